@@ -6,15 +6,28 @@ which is faster than generating plots from raw data.
 """
 
 import argparse
+import errno
+import fnmatch
+import functools
 import logging
+import os
+import posixpath
+import re
 import sys
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 from datetime import datetime
 
+import requests
+
 from scripts.wandb_utils import (
+    get_api,
     get_run,
+    mount_pooled_adapter,
+    parse_entity_project,
     setup_logging,
     WandBAuthError,
     progress_wrap,
@@ -22,54 +35,217 @@ from scripts.wandb_utils import (
     write_metadata_json,
 )
 
+DEFAULT_CONCURRENCY = 8
+# Upper bound on parallel downloads; matches the session's connection pool size
+MAX_CONCURRENCY = 100
+# Default cap on files scanned from a run's full listing (--max-files)
+MAX_LISTED_FILES = 10000
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+DEFAULT_PATTERNS = [
+    "media/images/*.png",
+    "media/plots/*.png",
+    "*.png",
+    "media/images/*.jpg",
+    "media/images/*.jpeg",
+    "plots/*.png",
+    "figures/*.png",
+]
+
+
+def _build_session() -> requests.Session:
+    """Build a keep-alive HTTP session shared by all file downloads."""
+    return mount_pooled_adapter(
+        requests.Session(),
+        pool_connections=20,
+        pool_maxsize=MAX_CONCURRENCY,
+        backoff_factor=0.3,
+    )
+
+
+# All files of a run live on the same storage host, so one pooled session
+# lets parallel downloads reuse connections instead of re-handshaking per file.
+_SESSION = _build_session()
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Translate a glob pattern into a compiled regex once."""
+    return re.compile(fnmatch.translate(pattern))
+
 
-def find_plot_files(run, patterns: Optional[List[str]] = None) -> List:
+_COMPILED_DEFAULT_PATTERNS = [_compile_pattern(pattern) for pattern in DEFAULT_PATTERNS]
+
+
+def find_plot_files(
+    run,
+    patterns: Optional[List[str]] = None,
+    max_files: int = MAX_LISTED_FILES
+) -> List:
     """
     Find plot files in a run using multiple patterns.
 
+    A single explicit pattern is filtered server-side and returns every
+    match. Otherwise the run's file listing is fetched once and matched
+    against every pattern locally, instead of issuing one query per pattern;
+    that listing is scanned up to ``max_files`` entries, with a warning when
+    the cap cuts it short.
+
     Args:
         run: W&B run object
         patterns: List of glob patterns to try (default: common image patterns)
+        max_files: Maximum number of listed files to scan when matching locally
 
     Returns:
         List of file objects matching the patterns
     """
+    if patterns is not None and len(patterns) == 1:
+        try:
+            return list(run.files(pattern=patterns[0]))
+        except Exception:
+            # Pattern might not be supported or no files match
+            return []
+
     if patterns is None:
         # Try multiple common patterns
-        patterns = [
-            "media/images/*.png",
-            "media/plots/*.png",
-            "*.png",
-            "media/images/*.jpg",
-            "media/images/*.jpeg",
-            "plots/*.png",
-            "figures/*.png",
-        ]
+        compiled = _COMPILED_DEFAULT_PATTERNS
+    else:
+        compiled = [_compile_pattern(pattern) for pattern in patterns]
+
+    try:
+        # One extra entry tells whether the cap truncated the listing
+        listed_files = list(islice(run.files(), max_files + 1))
+    except Exception:
+        return []
+    if len(listed_files) > max_files:
+        logging.getLogger(__name__).warning(
+            "Run has more than %d files; only the first %d were searched for plots "
+            "(raise --max-files or pass --pattern to search them all)",
+            max_files, max_files,
+        )
+        del listed_files[max_files:]
 
     all_files = []
     seen_names = set()
 
-    for pattern in patterns:
-        try:
-            files = run.files(pattern=pattern)
-            for file in files:
-                # Avoid duplicates
-                if file.name not in seen_names:
-                    all_files.append(file)
-                    seen_names.add(file.name)
-        except Exception:
-            # Pattern might not be supported or no files match
+    for file in listed_files:
+        # Avoid duplicates
+        if file.name in seen_names:
             continue
+        if any(regex.match(file.name) for regex in compiled):
+            all_files.append(file)
+            seen_names.add(file.name)
 
     return all_files
 
 
+def _existing_file_names(output_path: Path) -> Set[str]:
+    """Return names of files already in the output directory with a single scan."""
+    try:
+        with os.scandir(output_path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+def _stream_to_path(url: str, local_path: Path) -> None:
+    """Stream a URL into local_path over the shared session.
+
+    The body is written to a temporary file next to local_path and moved into
+    place only once complete, so a failed request never truncates or removes
+    an existing copy.
+    """
+    tmp_path = local_path.with_name(f".{local_path.name}.{os.getpid()}.part")
+    try:
+        with _SESSION.get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        os.replace(tmp_path, local_path)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _download_one(
+    file,
+    output_path: Path,
+    force: bool = False
+) -> Tuple[str, Optional[str], Optional[Exception]]:
+    """
+    Download a single run file into the flat output directory.
+
+    Args:
+        file: W&B file object
+        output_path: Directory to place the file in
+        force: If True, overwrite an existing local file
+
+    Returns:
+        Tuple of (file name, local path or None, error or None)
+    """
+    logger = logging.getLogger(__name__)
+    # Construct local path (run file names always use forward slashes)
+    basename = posixpath.basename(file.name)
+    local_path = output_path / basename
+
+    # Download file
+    try:
+        logger.debug("Downloading file %s", file.name)
+
+        # Prefer streaming the signed storage URL straight into the flat path
+        direct_url = getattr(file, "direct_url", None)
+        if isinstance(direct_url, str) and direct_url:
+            try:
+                _stream_to_path(direct_url, local_path)
+                return file.name, str(local_path), None
+            except Exception as e:
+                # Expired signed URLs or storage needing auth: let wandb fetch it
+                logger.debug("Direct download of %s failed (%s); using file.download", file.name, e)
+
+        # Fallback: wandb recreates file.name's directory structure under root
+        file.download(root=str(output_path), replace=force)
+
+        # The file is downloaded to output_path/file.name; a missing file
+        # surfaces as an error from the rename below
+        downloaded_file = output_path / file.name
+        if downloaded_file != local_path:
+            # Move file to flat structure (same directory tree, so a plain rename)
+            try:
+                os.replace(downloaded_file, local_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(downloaded_file), str(local_path))
+        return file.name, str(local_path), None
+    except Exception as e:
+        return file.name, None, e
+
+
+def _prune_empty_dirs(output_path: Path, file_names: List[str]) -> None:
+    """Best-effort cleanup of now-empty parent dirs left behind by downloads."""
+    parents = {(output_path / name).parent for name in file_names}
+    # Deepest first so nested dirs are emptied before their parents
+    for parent in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+        while parent != output_path and output_path in parent.parents:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
+
 def download_plots(
     entity_project: str,
     run_id: str,
     pattern: Optional[str] = None,
     output_dir: Optional[str] = None,
-    force: bool = False
+    force: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_files: int = MAX_LISTED_FILES
 ) -> List[str]:
     """
     Download existing plot files from W&B run.
@@ -80,6 +256,8 @@ def download_plots(
         pattern: Optional custom glob pattern (default: tries multiple patterns)
         output_dir: Optional custom output directory
         force: If True, re-download even if files exist
+        concurrency: Maximum number of parallel downloads
+        max_files: Maximum number of listed files to scan without a pattern
 
     Returns:
         List of downloaded file paths
@@ -92,8 +270,102 @@ def download_plots(
         >>> files = download_plots("my-org/my-project", "abc123")
         >>> print(f"Downloaded {len(files)} files")
     """
-    logger = logging.getLogger(__name__)
     run = get_run(entity_project, run_id)
+    return _download_run_plots(
+        entity_project,
+        run,
+        pattern=pattern,
+        output_dir=output_dir,
+        force=force,
+        concurrency=concurrency,
+        max_files=max_files
+    )
+
+
+def download_plots_bulk(
+    entity_project: str,
+    run_ids: List[str],
+    pattern: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    force: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_files: int = MAX_LISTED_FILES
+) -> Dict[str, List[str]]:
+    """
+    Download existing plot files from several runs of one project.
+
+    All runs are resolved with a single filtered ``api.runs`` query instead
+    of one ``api.run`` lookup per run.
+
+    Args:
+        entity_project: Project in format "entity/project" or "project"
+        run_ids: Run IDs to download from
+        pattern: Optional custom glob pattern (default: tries multiple patterns)
+        output_dir: Optional custom output directory (one subfolder per run)
+        force: If True, re-download even if files exist
+        concurrency: Maximum number of parallel downloads per run
+        max_files: Maximum number of listed files to scan per run without a pattern
+
+    Returns:
+        Dict mapping run ID to its list of downloaded file paths
+
+    Raises:
+        WandBAuthError: If not authenticated
+        ValueError: If the project or any run is not found
+
+    Example:
+        >>> files = download_plots_bulk("my-org/my-project", ["abc123", "def456"])
+        >>> print({run_id: len(paths) for run_id, paths in files.items()})
+    """
+    run_ids = list(dict.fromkeys(rid.strip() for rid in run_ids if rid and rid.strip()))
+    if not run_ids:
+        raise ValueError("run_ids cannot be empty")
+
+    api = get_api()
+    entity, project = parse_entity_project(entity_project, api=api)
+
+    try:
+        runs = list(api.runs(
+            f"{entity}/{project}",
+            filters={"name": {"$in": run_ids}}
+        ))
+    except Exception as e:
+        raise ValueError(
+            f"Error accessing project '{entity}/{project}': {str(e)}"
+        ) from e
+
+    runs_by_id = {run.id: run for run in runs}
+    missing = [rid for rid in run_ids if rid not in runs_by_id]
+    if missing:
+        raise ValueError(
+            f"Runs not found in project '{entity}/{project}': {', '.join(missing)}"
+        )
+
+    downloaded = {}
+    for rid in run_ids:
+        downloaded[rid] = _download_run_plots(
+            entity_project,
+            runs_by_id[rid],
+            pattern=pattern,
+            output_dir=str(Path(output_dir) / rid) if output_dir else None,
+            force=force,
+            concurrency=concurrency,
+            max_files=max_files
+        )
+    return downloaded
+
+
+def _download_run_plots(
+    entity_project: str,
+    run,
+    pattern: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    force: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_files: int = MAX_LISTED_FILES
+) -> List[str]:
+    """Download plot files for an already-resolved run (see download_plots)."""
+    logger = logging.getLogger(__name__)
 
     # Find plot files
     if pattern:
@@ -101,7 +373,7 @@ def download_plots(
     else:
         patterns = None
 
-    plot_files = find_plot_files(run, patterns)
+    plot_files = find_plot_files(run, patterns, max_files=max_files)
 
     if not plot_files:
         return []
@@ -109,56 +381,72 @@ def download_plots(
     # Determine output directory (only if there is work to do)
     output_path = resolve_output_dir(entity_project, run, output_dir=output_dir)
 
-    # Download files
+    # Resolve already-present files up front so only real downloads hit the pool
+    existing_names = set() if force else _existing_file_names(output_path)
+    results = [None] * len(plot_files)
+    pending = []
+    claimed = {}
+    skipped = 0
+    for idx, file in enumerate(plot_files):
+        basename = posixpath.basename(file.name)
+        if basename in claimed:
+            # Files share one flat directory; the first match owns the name
+            logger.warning(
+                "Skipping %s: %s already maps to %s", file.name, claimed[basename], basename
+            )
+            continue
+        claimed[basename] = file.name
+        if basename in existing_names:
+            logger.debug("Skipping existing file %s", file.name)
+            results[idx] = (file.name, str(output_path / basename), None)
+            skipped += 1
+        else:
+            pending.append(idx)
+    if skipped:
+        print(f"Skipping {skipped} file(s) that already exist (use --force to re-download)")
+
+    # Download files concurrently; the work is network-bound so threads overlap latency
+    if pending:
+        # Never spawn more threads than files, nor more than pooled connections
+        max_workers = max(1, min(concurrency or DEFAULT_CONCURRENCY, MAX_CONCURRENCY, len(pending)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_download_one, plot_files[idx], output_path, force): idx
+                for idx in pending
+            }
+            progress = progress_wrap(as_completed(futures), "Downloading plots", total=len(futures))
+            set_postfix = getattr(progress, "set_postfix_str", None)
+            for future in progress:
+                result = future.result()
+                results[futures[future]] = result
+                if set_postfix is not None:
+                    set_postfix(result[0])
+
+        # Directories are shared between files, so only prune once every download is done
+        _prune_empty_dirs(output_path, [plot_files[idx].name for idx in pending])
+
+    # Collect results in listing order once the pool drains
     downloaded_paths = []
-
-    for file in progress_wrap(plot_files, "Downloading plots"):
-        # Construct local path
-        local_path = output_path / Path(file.name).name
-
-        # Skip if exists and not forcing
-        if local_path.exists() and not force:
-            print(f"Skipping {file.name} (already exists)")
-            logger.info("Skipping existing file %s", file.name)
-            downloaded_paths.append(str(local_path))
+    downloaded_names = []
+    newly_downloaded = 0
+    for result in results:
+        if result is None:
+            # Basename collision skipped above
             continue
-
-        # Download file
-        try:
-            print(f"Downloading {file.name}...")
-            logger.info("Downloading file %s", file.name)
-            file.download(root=str(output_path), replace=force)
-
-            # The file is downloaded to output_path/file.name structure
-            # We need to handle the directory structure
-            downloaded_file = output_path / file.name
-            if downloaded_file.exists():
-                final_path = output_path / Path(file.name).name
-                if downloaded_file != final_path:
-                    # Move file to flat structure
-                    shutil.move(str(downloaded_file), str(final_path))
-                    # Best-effort cleanup of now-empty parent dirs.
-                    parent = downloaded_file.parent
-                    while parent != output_path:
-                        try:
-                            parent.rmdir()
-                        except OSError:
-                            break
-                        parent = parent.parent
-                downloaded_paths.append(str(final_path))
-            else:
-                # File might be in current directory structure already
-                final_path = output_path / Path(file.name).name
-                if final_path.exists():
-                    downloaded_paths.append(str(final_path))
-
-        except Exception as e:
-            logger.warning("Failed to download %s: %s", file.name, e)
-            print(f"Warning: Failed to download {file.name}: {e}", file=sys.stderr)
+        name, local_path, error = result
+        if error is not None:
+            logger.warning("Failed to download %s: %s", name, error)
+            print(f"Warning: Failed to download {name}: {error}", file=sys.stderr)
             continue
-
-    # Create metadata file
-    if downloaded_paths:
+        if local_path:
+            basename = posixpath.basename(name)
+            downloaded_paths.append(local_path)
+            downloaded_names.append(basename)
+            if basename not in existing_names:
+                newly_downloaded += 1
+
+    # Create metadata file (skipped when every file already existed locally)
+    if newly_downloaded:
         metadata = {
             "run_id": run.id,
             "run_name": run.name,
@@ -166,7 +454,7 @@ def download_plots(
             "project": getattr(run, "project", None),
             "download_timestamp": datetime.now().isoformat(),
             "pattern_used": pattern if pattern else "auto",
-            "files_downloaded": [str(Path(p).name) for p in downloaded_paths],
+            "files_downloaded": downloaded_names,
             "file_count": len(downloaded_paths)
         }
 
@@ -192,8 +480,14 @@ Examples:
   # Force re-download
   %(prog)s my-org/my-project abc123 --force
 
+  # Download with more parallel connections
+  %(prog)s my-org/my-project abc123 --concurrency 16
+
   # Custom output directory
   %(prog)s my-org/my-project abc123 --output ./my_plots
+
+  # Download from several runs at once (comma-separated run ids)
+  %(prog)s my-org/my-project run1,run2,run3
         """
     )
 
@@ -203,7 +497,7 @@ Examples:
     )
     parser.add_argument(
         "run_id",
-        help="Run ID or name"
+        help="Run ID or name (comma-separated run IDs for multiple runs)"
     )
     parser.add_argument(
         "--pattern",
@@ -218,18 +512,48 @@ Examples:
         action="store_true",
         help="Force re-download even if files already exist"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of parallel downloads (default: {DEFAULT_CONCURRENCY}, max: {MAX_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--max-files",
+        type=int,
+        default=MAX_LISTED_FILES,
+        help=f"Files scanned from the run's listing when no --pattern is given (default: {MAX_LISTED_FILES})"
+    )
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.max_files < 1:
+        parser.error("--max-files must be at least 1")
 
     try:
         # Download plots
-        downloaded = download_plots(
-            args.entity_project,
-            args.run_id,
-            pattern=args.pattern,
-            output_dir=args.output,
-            force=args.force
-        )
+        if "," in args.run_id:
+            downloaded_by_run = download_plots_bulk(
+                args.entity_project,
+                args.run_id.split(","),
+                pattern=args.pattern,
+                output_dir=args.output,
+                force=args.force,
+                concurrency=args.concurrency,
+                max_files=args.max_files
+            )
+            downloaded = [path for paths in downloaded_by_run.values() for path in paths]
+        else:
+            downloaded = download_plots(
+                args.entity_project,
+                args.run_id,
+                pattern=args.pattern,
+                output_dir=args.output,
+                force=args.force,
+                concurrency=args.concurrency,
+                max_files=args.max_files
+            )
 
         if downloaded:
             print(f"\nSuccessfully downloaded {len(downloaded)} file(s):")
@@ -5,17 +5,20 @@ This script generates publication-quality line plots from metric data,
 with intelligent axis scaling and optional smoothing.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import logging
+import operator
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple, Iterable
+from typing import TYPE_CHECKING, Any, Container, Dict, Iterable, List, Mapping, Optional, Tuple
 from datetime import datetime
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
 
 from scripts.wandb_utils import (
     get_run,
@@ -27,74 +30,324 @@ from scripts.wandb_utils import (
     write_metadata_json,
 )
 
+# matplotlib and pandas are imported on first use so that --help and
+# argument/auth errors do not pay for loading them
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+FIGURE_SIZE = (10, 6)
+PLOT_DPI = 150
+# Series longer than 4x this are LTTB-downsampled to ~2 points per pixel column
+MAX_PLOT_POINTS = 2 * FIGURE_SIZE[0] * PLOT_DPI
+
+# Rows between progress bar checks while streaming full-resolution history
+HISTORY_PROGRESS_MINITERS = 1000
+
+# Block length and maximum |cumulative log decay| for the vectorized EMA scan;
+# exp(300) ~ 1e130 leaves ample headroom before float64 overflow.
+_EMA_BLOCK_SIZE = 1024
+_EMA_MAX_LOG_SPAN = 300.0
+
+# Plot buffers are float32 unless a loss spans more decades than this, or the
+# values vary by less than this fraction of their magnitude (float32 keeps
+# ~7 significant digits, so e.g. Unix timestamps would collapse into steps)
+_FLOAT32_MAX_DECADES = 5
+_FLOAT32_MIN_RELATIVE_RANGE = 1e-4
+
+
+def _as_float_array(values: Iterable) -> np.ndarray:
+    """Convert an iterable of numbers into a float64 numpy array."""
+    if not hasattr(values, '__len__'):
+        values = list(values)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _as_float_seconds(values: Iterable) -> np.ndarray:
+    """Convert x-axis values to float64, mapping datetimes/timedeltas to seconds."""
+    import pandas as pd
+
+    if not hasattr(values, '__len__'):
+        values = list(values)
+    series = pd.Series(values)
+    if len(series) and (
+        pd.api.types.is_datetime64_any_dtype(series)
+        or pd.api.types.is_timedelta64_dtype(series)
+    ):
+        return (series - series.iloc[0]).dt.total_seconds().to_numpy(dtype=np.float64)
+    return series.to_numpy(dtype=np.float64)
+
 
 def time_weighted_ema(
     x_values: Iterable[float],
     y_values: Iterable[float],
     weight: float,
     viewport_scale: float
-) -> List[float]:
-    """Compute debiased, time-weighted EMA matching W&B's TWEMA behavior."""
-    x_list = list(x_values)
-    y_list = list(y_values)
-    if not y_list:
-        return []
-
-    x_min = min(x_list) if x_list else 0.0
-    x_max = max(x_list) if x_list else 0.0
-    range_of_x = float(x_max - x_min) if x_list else 0.0
+) -> np.ndarray:
+    """Compute debiased, time-weighted EMA matching W&B's TWEMA behavior.
+
+    The recurrence is evaluated in float64; float32 input gives float32 output.
+    """
+    out_dtype = _result_dtype(y_values)
+    y = _as_float_array(y_values)
+    n = len(y)
+    if n == 0:
+        return np.empty(0, dtype=out_dtype)
+
+    x = _as_float_seconds(x_values)
+    if len(x):
+        range_of_x = float(x.max() - x.min())
+        # First point has no predecessor, so its delta is zero
+        deltas = np.diff(x, prepend=x[0])
+    else:
+        range_of_x = 0.0
+        deltas = np.ones(n, dtype=np.float64)
     if range_of_x <= 0:
         range_of_x = 1.0
 
-    last_y = 0.0
-    debias_weight = 0.0
-    smoothed = []
+    if weight <= 0:
+        # log(weight) is undefined; use the plain recurrence
+        decay = np.power(weight, deltas * (viewport_scale / range_of_x))
+        last_y = _decayed_cumsum_scalar(y, decay)
+        debias_weight = _decayed_cumsum_scalar(np.ones(n), decay)
+    else:
+        log_decay = deltas * (viewport_scale / range_of_x * np.log(weight))
+        last_y = _decayed_cumsum(y, log_decay)
+        debias_weight = _decayed_cumsum(np.ones(n), log_decay)
+
+    return (last_y / debias_weight).astype(out_dtype, copy=False)
+
+
+def _result_dtype(values) -> np.dtype:
+    """Float dtype to return for ``values``: float32 stays float32, else float64."""
+    if getattr(values, 'dtype', None) == np.float32:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def _decayed_cumsum_scalar(values: np.ndarray, decay: np.ndarray) -> np.ndarray:
+    """Evaluate ``acc[i] = acc[i - 1] * decay[i] + values[i]`` one point at a time."""
+    out = np.empty(len(values), dtype=np.float64)
+    acc = 0.0
+    for idx, (value, factor) in enumerate(zip(values.tolist(), decay.tolist())):
+        acc = acc * factor + value
+        out[idx] = acc
+    return out
+
+
+def _decayed_cumsum(
+    values: np.ndarray,
+    log_decay: np.ndarray,
+    block_size: int = _EMA_BLOCK_SIZE
+) -> np.ndarray:
+    """Vectorized ``acc[i] = acc[i - 1] * exp(log_decay[i]) + values[i]``.
+
+    Within a block, with ``L`` the cumulative sum of ``log_decay``, the
+    recurrence has the closed form ``exp(L) * (carry + cumsum(values * exp(-L)))``.
+    Blocks keep ``L`` small enough that ``exp(-L)`` cannot overflow; a block
+    whose decay spans too wide a range falls back to the scalar recurrence.
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    carry = 0.0
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        cum_log = np.cumsum(log_decay[start:stop])
+        if np.all(np.abs(cum_log) <= _EMA_MAX_LOG_SPAN):
+            out[start:stop] = np.exp(cum_log) * (
+                carry + np.cumsum(values[start:stop] * np.exp(-cum_log))
+            )
+        else:
+            decay = np.exp(log_decay[start:stop])
+            block = _decayed_cumsum_scalar(values[start:stop], decay)
+            # Fold the carry from the previous block into the scalar result
+            out[start:stop] = block + carry * np.cumprod(decay)
+        carry = out[stop - 1]
+    return out
+
+
+def rolling_mean(y_values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean with ``min_periods=1`` semantics, via one prefix sum.
+
+    The prefix sum is accumulated in float64; float32 input gives float32 output.
+    """
+    out_dtype = _result_dtype(y_values)
+    y = np.asarray(y_values, dtype=np.float64)
+    n = len(y)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out.astype(out_dtype, copy=False)
+    window = max(1, int(window))
+    prefix = np.concatenate(([0.0], np.cumsum(y)))
+    head = min(window, n)
+    # The first points average over everything seen so far
+    out[:head] = prefix[1:head + 1] / np.arange(1, head + 1)
+    if n > window:
+        out[window:] = (prefix[window + 1:] - prefix[1:n + 1 - window]) / window
+    return out.astype(out_dtype, copy=False)
+
+
+def lttb_indices(x_values: np.ndarray, y_values: np.ndarray, n_out: int) -> np.ndarray:
+    """Select indices with Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, for each of ``n_out - 2`` equal
+    buckets in between, the point forming the largest triangle with the
+    previously selected point and the mean of the next bucket.
+    """
+    x = np.asarray(x_values, dtype=np.float64)
+    y = np.asarray(y_values, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries over the interior points [1, n - 1)
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+    counts = np.diff(np.append(edges, n))
+    # Mean of each bucket (plus the last point as a final pseudo-bucket)
+    bucket_x = np.add.reduceat(x, edges) / counts
+    bucket_y = np.add.reduceat(y, edges) / counts
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_x, next_y = bucket_x[bucket + 1], bucket_y[bucket + 1]
+        ax, ay = x[selected], y[selected]
+        areas = np.abs(
+            (ax - next_x) * (y[start:stop] - ay)
+            - (ax - x[start:stop]) * (next_y - ay)
+        )
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def _downsample(x_data: np.ndarray, y_values) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to roughly the figure's pixel width before plotting."""
+    y = np.asarray(y_values)
+    if y.dtype.kind != 'f':
+        y = y.astype(np.float64)
+    if len(y) <= 4 * MAX_PLOT_POINTS:
+        return x_data, y
+    indices = lttb_indices(_as_float_seconds(x_data), y, MAX_PLOT_POINTS)
+    return x_data[indices], y[indices]
+
+
+def _metric_kind(metric: str) -> str:
+    """Classify a metric name for y-axis scaling: 'loss', 'acc' or 'other'."""
+    name = metric.lower()
+    if 'loss' in name:
+        return 'loss'
+    if 'acc' in name:
+        return 'acc'
+    return 'other'
+
+
+def _plot_dtype(metric_kind: str, stats: Tuple[float, float, float]) -> type:
+    """Pick the float dtype for a metric's plot buffer from its ``_y_stats``.
+
+    float32 halves the memory traffic through smoothing and drawing, and its
+    ~7 significant digits are finer than a 150 dpi raster as long as the
+    values' range is not tiny next to their magnitude. Series that vary only
+    in their trailing digits (timestamps, counters, values hovering near a
+    constant) and log-scaled losses spanning many decades keep float64.
+    """
+    y_min, y_max, y_min_positive = stats
+    if not (np.isfinite(y_min) and np.isfinite(y_max)):
+        return np.float64
+    magnitude = max(abs(y_min), abs(y_max))
+    if magnitude > 0 and (y_max - y_min) / magnitude < _FLOAT32_MIN_RELATIVE_RANGE:
+        return np.float64
+    if (
+        metric_kind == 'loss'
+        and np.isfinite(y_min_positive)
+        and y_max / y_min_positive > 10 ** _FLOAT32_MAX_DECADES
+    ):
+        return np.float64
+    return np.float32
+
+
+# Preferred x-axis columns and their labels, in priority order
+_X_AXES = (('_step', 'Step'), ('_timestamp', 'Timestamp'))
+
+
+def determine_x_axis(column_sets: Iterable[Container[str]]) -> Tuple[Optional[str], str]:
+    """Determine the shared x-axis column and label for a set of runs.
+
+    Every plot uses the preferred x-axis of the first run that has one.
+
+    Args:
+        column_sets: Column names of each run, in run order
+
+    Returns:
+        Tuple of (x-axis column or None to plot against the index, axis label)
+    """
+    for columns in column_sets:
+        for key, label in _X_AXES:
+            if key in columns:
+                return key, label
+    return None, 'Index'
+
+
+_FIGURES = threading.local()
+
 
-    for idx, y_point in enumerate(y_list):
-        prev_idx = idx - 1 if idx > 0 else 0
-        delta = x_list[idx] - x_list[prev_idx] if x_list else 1.0
-        if hasattr(delta, "total_seconds"):
-            delta = delta.total_seconds()
-        change_in_x = (float(delta) / range_of_x) * viewport_scale
-        smoothing_weight_adj = weight ** change_in_x
+def _pyplot():
+    """Import pyplot on the non-interactive Agg backend."""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+    return plt
 
-        last_y = last_y * smoothing_weight_adj + y_point
-        debias_weight = debias_weight * smoothing_weight_adj + 1.0
-        smoothed.append(last_y / debias_weight)
 
-    return smoothed
+@functools.lru_cache(maxsize=1)
+def _run_colors() -> Tuple[Tuple[float, float, float], ...]:
+    """Return the tab10 palette used to color runs, cycled in order."""
+    return tuple(_pyplot().get_cmap('tab10').colors)
 
 
-def determine_x_axis(
-    df: pd.DataFrame
-) -> Tuple[pd.Series, str, Optional[str]]:
-    """Determine x-axis data and label for a dataframe."""
-    if '_step' in df.columns:
-        return df['_step'], 'Step', '_step'
-    if '_timestamp' in df.columns:
-        return df['_timestamp'], 'Timestamp', '_timestamp'
-    return pd.Series(df.index), 'Index', None
+def _get_figure():
+    """Return this thread's reusable ``(fig, ax)`` pair, creating it on first use.
+
+    Keeping one figure alive (and clearing its axes between plots) avoids
+    re-allocating the Agg canvas, fonts and tick machinery for every metric.
+    Worker processes each build their own on first use.
+    """
+    cached = getattr(_FIGURES, "pair", None)
+    if cached is None:
+        # Constrained layout is solved once at draw time, so saving needs
+        # neither tight_layout() nor a bbox_inches='tight' re-render
+        cached = _pyplot().subplots(figsize=FIGURE_SIZE, layout='constrained')
+        _FIGURES.pair = cached
+    return cached
 
 
 def plot_metric(
-    run_data: List[Tuple[str, pd.DataFrame]],
+    run_data: List[Tuple[str, Mapping[str, np.ndarray]]],
     metric: str,
     output_path: str,
     smooth: Optional[int] = None,
     ema_weight: Optional[float] = 0.99,
     ema_enabled: bool = True,
-    viewport_scale: float = 1000.0
+    viewport_scale: float = 1000.0,
+    metric_kind: Optional[str] = None
 ):
     """
     Generate a single metric plot.
 
     Args:
-        run_data: List of (label, DataFrame) pairs with metric data
+        run_data: List of (label, columns) pairs, where columns maps column
+            names to value arrays (as built by column_arrays; a DataFrame also works)
         metric: Name of metric column to plot
         output_path: Path to save plot
         smooth: Optional rolling average window size
         ema_weight: EMA weight (0-1) when enabled
         ema_enabled: Whether to render EMA-smoothed line
+        viewport_scale: Scale factor for time-weighted EMA normalization
+        metric_kind: Precomputed 'loss'/'acc'/'other' class of the metric name
+            (derived from ``metric`` when omitted)
 
     Raises:
         ValueError: If metric not in DataFrame
@@ -102,102 +355,247 @@ def plot_metric(
     if not run_data:
         raise ValueError("No run data provided for plotting")
 
-    plt.figure(figsize=(10, 6))
+    fig, ax = _get_figure()
+    try:
+        _draw_metric(
+            ax, run_data, metric, smooth, ema_weight, ema_enabled, viewport_scale,
+            metric_kind or _metric_kind(metric)
+        )
+        fig.savefig(output_path, dpi=PLOT_DPI)
+    finally:
+        # Clear instead of closing so the next plot reuses the canvas
+        ax.cla()
+
+    print(f"Generated: {output_path}")
+
 
-    x_label = None
-    x_key = None
-    for _, df in run_data:
-        x_data, x_label, x_key = determine_x_axis(df)
-        if x_key:
-            break
-    if x_label is None:
-        x_label = 'Index'
+def _draw_metric(
+    ax,
+    run_data: List[Tuple[str, Mapping[str, np.ndarray]]],
+    metric: str,
+    smooth: Optional[int],
+    ema_weight: Optional[float],
+    ema_enabled: bool,
+    viewport_scale: float,
+    metric_kind: str
+):
+    """Draw one metric's lines, labels and axis scaling onto ``ax``."""
+    x_key, x_label = determine_x_axis(columns for _, columns in run_data)
 
-    colors = plt.get_cmap('tab10')
+    colors = _run_colors()
     multiple_runs = len(run_data) > 1
     used_labels = set()
 
     lines_plotted = 0
+    run_stats = []
 
-    for idx, (label, df) in enumerate(run_data):
-        if metric not in df.columns:
+    for idx, (label, columns) in enumerate(run_data):
+        if metric not in columns:
             continue
 
-        if x_key and x_key in df.columns:
-            x_data = df[x_key]
+        y_values = np.asarray(columns[metric], dtype=np.float64)
+        if x_key and x_key in columns:
+            x_data = np.asarray(columns[x_key])
         else:
-            x_data = pd.Series(df.index)
-        y_data = df[metric]
+            x_data = np.arange(len(y_values))
 
-        mask = ~y_data.isna()
-        x_data = x_data[mask]
-        y_data = y_data[mask]
+        # Drops NaN as well as +/-inf, which cannot be drawn or scaled
+        finite = np.isfinite(y_values)
+        x_data = x_data[finite]
+        y_values = y_values[finite]
 
-        if len(y_data) == 0:
+        if len(y_values) == 0:
             continue
+        stats = _y_stats([y_values])
+        run_stats.append(stats)
+        y_values = y_values.astype(_plot_dtype(metric_kind, stats), copy=False)
 
-        color = colors(idx % colors.N)
+        color = colors[idx % len(colors)]
         plot_label = label
         if plot_label in used_labels:
             plot_label = f"{label} ({idx + 1})"
         used_labels.add(plot_label)
 
         if smooth and smooth > 1:
-            y_series = pd.Series(y_data.values)
-            y_smoothed = y_series.rolling(window=smooth, min_periods=1).mean()
-            y_data_smoothed = y_smoothed.values
-            plt.plot(x_data, y_data, linewidth=1, alpha=0.25, color=color)
-            plt.plot(x_data, y_data_smoothed, linewidth=2, alpha=0.9, color=color, label=plot_label)
+            y_data_smoothed = rolling_mean(y_values, smooth)
+            ax.plot(*_downsample(x_data, y_values), linewidth=1, alpha=0.25, color=color)
+            ax.plot(*_downsample(x_data, y_data_smoothed), linewidth=2, alpha=0.9, color=color, label=plot_label)
             lines_plotted += 1
         elif ema_enabled and ema_weight is not None:
-            y_smoothed = time_weighted_ema(x_data, y_data, ema_weight, viewport_scale)
-            plt.plot(x_data, y_data, linewidth=1, alpha=0.25, color=color)
-            plt.plot(x_data, y_smoothed, linewidth=2, alpha=0.9, color=color, label=plot_label)
+            y_smoothed = time_weighted_ema(x_data, y_values, ema_weight, viewport_scale)
+            ax.plot(*_downsample(x_data, y_values), linewidth=1, alpha=0.25, color=color)
+            ax.plot(*_downsample(x_data, y_smoothed), linewidth=2, alpha=0.9, color=color, label=plot_label)
             lines_plotted += 1
         else:
-            plt.plot(x_data, y_data, linewidth=2, alpha=0.85, color=color, label=plot_label)
+            ax.plot(*_downsample(x_data, y_values), linewidth=2, alpha=0.85, color=color, label=plot_label)
             lines_plotted += 1
 
     if lines_plotted == 0:
         raise ValueError(f"Metric '{metric}' has no valid data points")
 
     if multiple_runs:
-        plt.legend()
+        ax.legend()
 
     # Labels and title
-    plt.xlabel(x_label, fontsize=12)
-    plt.ylabel(metric, fontsize=12)
-    plt.title(f'{metric}', fontsize=14, pad=20)
+    ax.set_xlabel(x_label, fontsize=12)
+    ax.set_ylabel(metric, fontsize=12)
+    ax.set_title(f'{metric}', fontsize=14, pad=20)
 
     # Grid
-    plt.grid(True, alpha=0.3, linestyle='--')
+    ax.grid(True, alpha=0.3, linestyle='--')
 
     # Intelligent y-axis scaling
-    metric_values = []
-    for _, df in run_data:
-        if metric in df.columns:
-            metric_values.append(df[metric].dropna())
-    if metric_values:
-        all_values = pd.concat(metric_values)
-        if 'loss' in metric.lower():
-            positive = all_values[all_values > 0]
-            if not positive.empty:
-                y_min, y_max = positive.min(), positive.max()
-                if y_min > 0 and (y_max / y_min) > 10:
-                    plt.yscale('log')
-                    plt.ylabel(f'{metric} (log scale)', fontsize=12)
-        elif 'acc' in metric.lower() or 'accuracy' in metric.lower():
-            if all_values.max() <= 1.0 and all_values.min() >= 0.0:
-                plt.ylim(-0.05, 1.05)
-
-    # Tight layout
-    plt.tight_layout()
-
-    # Save figure
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    y_min = min(stats[0] for stats in run_stats)
+    y_max = max(stats[1] for stats in run_stats)
+    y_min_positive = min(stats[2] for stats in run_stats)
+    if metric_kind == 'loss':
+        # The largest positive value is the overall max whenever any exist
+        if np.isfinite(y_min_positive) and (y_max / y_min_positive) > 10:
+            ax.set_yscale('log')
+            ax.set_ylabel(f'{metric} (log scale)', fontsize=12)
+    elif metric_kind == 'acc':
+        if y_max <= 1.0 and y_min >= 0.0:
+            ax.set_ylim(-0.05, 1.05)
+
+
+def _y_stats(arrays: List[np.ndarray]) -> Tuple[float, float, float]:
+    """Return (min, max, smallest positive) across arrays, inf-padded if empty."""
+    v_min, v_max, p_min = np.inf, -np.inf, np.inf
+    for values in arrays:
+        values = np.asarray(values)
+        if values.size == 0:
+            continue
+        v_min = min(v_min, values.min())
+        v_max = max(v_max, values.max())
+        # Masked reduction rather than materializing values[values > 0]
+        p_min = min(p_min, values.min(where=values > 0, initial=np.inf))
+    return float(v_min), float(v_max), float(p_min)
 
-    print(f"Generated: {output_path}")
+
+def history_rows_to_frame(
+    rows: Iterable[Dict[str, Any]],
+    keys: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Build a DataFrame from streamed history rows, column by column.
+
+    Values are accumulated per column (missing values become NaN) and each
+    column is converted to a typed numpy array in a single pass, which avoids
+    pandas inferring a schema from every row dict.
+
+    Args:
+        rows: Iterable of history row dicts (e.g. from ``run.scan_history()``)
+        keys: Columns to keep; when omitted, every key found in the rows is
+            kept, with columns added as they first appear
+
+    Returns:
+        DataFrame with one column per key
+    """
+    import pandas as pd
+
+    nan = float("nan")
+    if keys:
+        # Fixed schema: pull each row's values out in one C-level call
+        if len(keys) == 1:
+            key = keys[0]
+            records = [row.get(key, nan) for row in rows]
+            values_by_key = [records]
+        else:
+            getter = operator.itemgetter(*keys)
+            records = []
+            for row in rows:
+                try:
+                    records.append(getter(row))
+                except KeyError:
+                    records.append(tuple(row.get(key, nan) for key in keys))
+            values_by_key = zip(*records)
+        if not records:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {key: _column_to_array(list(values)) for key, values in zip(keys, values_by_key)},
+            copy=False
+        )
+
+    columns: Dict[str, list] = {}
+    n_rows = 0
+    for row in rows:
+        for key in row.keys() - columns.keys():
+            # Backfill a column first seen part-way through the stream
+            columns[key] = [nan] * n_rows
+        for key, values in columns.items():
+            values.append(row.get(key, nan))
+        n_rows += 1
+
+    if n_rows == 0:
+        return pd.DataFrame()
+    for key in columns:
+        # Replace each list as it is converted so only one copy is alive
+        columns[key] = _column_to_array(columns[key])
+    return pd.DataFrame(columns, copy=False)
+
+
+def _column_to_array(values: list) -> np.ndarray:
+    """Convert one history column to a 1-D array, typed where possible."""
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        # Ragged nested values (e.g. lists of different lengths)
+        array = None
+    if array is None or array.ndim != 1 or array.dtype.kind in 'USV':
+        array = np.empty(len(values), dtype=object)
+        for idx, value in enumerate(values):
+            array[idx] = value
+    elif array.dtype == object:
+        try:
+            # Numbers mixed with None
+            array = array.astype(np.float64)
+        except (TypeError, ValueError):
+            pass
+    return array
+
+
+def column_arrays(
+    df: pd.DataFrame,
+    metrics: List[str],
+    x_key: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """Extract the plotted metrics and x-axis columns of a history as numpy arrays.
+
+    Doing this once per run keeps pandas column lookups out of the per-metric
+    plotting loop. Numeric columns become float64 with missing values as NaN.
+
+    Args:
+        df: Run history DataFrame
+        metrics: Metric names to extract (absent ones are skipped)
+        x_key: The x-axis column to extract (default: every known x-axis column)
+
+    Returns:
+        Dict mapping column name to array
+    """
+    columns = {}
+    x_keys = [x_key] if x_key else [key for key, _ in _X_AXES]
+    for key in x_keys:
+        if key in df.columns:
+            columns[key] = df[key].to_numpy()
+    for metric in metrics:
+        if metric in df.columns and metric not in columns:
+            try:
+                columns[metric] = df[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+            except (TypeError, ValueError):
+                # Non-numeric; plot_metric reports it for this metric alone
+                columns[metric] = df[metric].to_numpy()
+    return columns
+
+
+def _metric_columns(
+    run_columns: List[Tuple[str, Dict[str, np.ndarray]]],
+    metric: str
+) -> List[Tuple[str, Dict[str, np.ndarray]]]:
+    """Trim each run's arrays to those needed to plot one metric."""
+    keys = (metric,) + tuple(key for key, _ in _X_AXES)
+    return [
+        (label, {key: columns[key] for key in keys if key in columns})
+        for label, columns in run_columns
+    ]
 
 
 def generate_plots(
@@ -212,7 +610,8 @@ def generate_plots(
     viewport_scale: float = 1000.0,
     group_by_prefix: bool = False,
     all_metrics: bool = False,
-    include_system: bool = False
+    include_system: bool = False,
+    workers: int = 1
 ) -> List[str]:
     """
     Generate plots from metric data.
@@ -230,6 +629,9 @@ def generate_plots(
         group_by_prefix: If True, group metrics by prefix folder (e.g., rewards/* -> rewards/)
         all_metrics: If True, plot all available metrics
         include_system: If True, include system metrics (prefixed with "_") when plotting all metrics
+        workers: Number of processes used to render plots (default: 1, rendering
+            serially in-process; worker start-up and re-imports only pay off for
+            many metrics)
 
     Returns:
         List of generated file paths
@@ -252,25 +654,36 @@ def generate_plots(
     if not run_ids:
         raise ValueError("run_id cannot be empty")
 
+    # Repeated run ids are looked up and fetched only once
+    runs_by_rid = {}
     runs = []
     for rid in run_ids:
-        runs.append(get_run(entity_project, rid))
+        if rid not in runs_by_rid:
+            runs_by_rid[rid] = get_run(entity_project, rid)
+        runs.append(runs_by_rid[rid])
 
     keys = None if all_metrics else list(dict.fromkeys(metrics + ["_step", "_timestamp"]))
     run_data = []
+    history_by_run = {}
     for run in runs:
+        if id(run) in history_by_run:
+            run_data.append((run.name or run.id, history_by_run[id(run)], run))
+            continue
         try:
             if full_resolution:
                 print("Fetching full resolution data (this may take a while)...")
                 logger.info("Fetching full resolution data for run %s", run.id)
-                history_data = []
                 try:
                     iterator = run.scan_history(keys=keys)
                 except TypeError:
                     iterator = run.scan_history()
-                for row in progress_wrap(iterator, f"Fetching history {run.id}"):
-                    history_data.append(row)
-                df = pd.DataFrame(history_data)
+                df = history_rows_to_frame(
+                    progress_wrap(
+                        iterator, f"Fetching history {run.id}",
+                        mininterval=0.5, miniters=HISTORY_PROGRESS_MINITERS
+                    ),
+                    keys=keys
+                )
             else:
                 print("Fetching sampled data...")
                 logger.info("Fetching sampled data for run %s", run.id)
@@ -285,11 +698,12 @@ def generate_plots(
             raise ValueError(f"Run {run.id} has no history data")
 
         label = run.name or run.id
+        history_by_run[id(run)] = df
         run_data.append((label, df, run))
 
     # Verify metrics exist
     def is_system_metric(name: str) -> bool:
-        return name.startswith("_") or name.startswith("system/")
+        return name.startswith(("_", "system/"))
 
     all_available = set()
     for _, df, _ in run_data:
@@ -328,9 +742,8 @@ def generate_plots(
         output_path.mkdir(parents=True, exist_ok=True)
 
     # Generate plots
-    generated_paths = []
-
-    for metric in progress_wrap(metrics, "Generating plots"):
+    output_files = []
+    for metric in metrics:
         # Create safe filename
         safe_metric_name = safe_filename(metric)
         metric_output_path = output_path
@@ -338,23 +751,59 @@ def generate_plots(
             prefix = safe_filename(metric.split("/", 1)[0])
             metric_output_path = output_path / prefix
             metric_output_path.mkdir(parents=True, exist_ok=True)
-        output_file = metric_output_path / f"{safe_metric_name}.png"
+        output_files.append(metric_output_path / f"{safe_metric_name}.png")
+
+    plot_kwargs = {
+        "smooth": smooth,
+        "ema_weight": ema_weight,
+        "ema_enabled": ema_enabled,
+        "viewport_scale": viewport_scale,
+    }
+    # Every plot shares the x-axis of the first run that has one, so only
+    # that column is extracted (once per run) alongside the metrics
+    x_key, _ = determine_x_axis(df.columns for _, df, _ in run_data)
+    run_columns = [(label, column_arrays(df, metrics, x_key)) for label, df, _ in run_data]
+    metric_kinds = {metric: _metric_kind(metric) for metric in metrics}
+
+    errors = {}
+    workers = min(workers, len(metrics))
+    if workers > 1:
+        # Each plot is an independent CPU-bound render, so fan out across processes
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    plot_metric,
+                    _metric_columns(run_columns, metric),
+                    metric,
+                    str(output_file),
+                    metric_kind=metric_kinds[metric],
+                    **plot_kwargs
+                ): metric
+                for metric, output_file in zip(metrics, output_files)
+            }
+            for future in progress_wrap(as_completed(futures), "Generating plots"):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+    else:
+        for metric, output_file in progress_wrap(list(zip(metrics, output_files)), "Generating plots"):
+            try:
+                plot_metric(
+                    run_columns, metric, str(output_file),
+                    metric_kind=metric_kinds[metric], **plot_kwargs
+                )
+            except Exception as e:
+                errors[metric] = e
 
-        try:
-            plot_metric(
-                [(label, df) for label, df, _ in run_data],
-                metric,
-                str(output_file),
-                smooth=smooth,
-                ema_weight=ema_weight,
-                ema_enabled=ema_enabled,
-                viewport_scale=viewport_scale
-            )
-            generated_paths.append(str(output_file))
-        except Exception as e:
+    generated_paths = []
+    for metric, output_file in zip(metrics, output_files):
+        if metric in errors:
+            e = errors[metric]
             logger.warning("Failed to generate plot for '%s': %s", metric, e)
             print(f"Warning: Failed to generate plot for '{metric}': {e}", file=sys.stderr)
             continue
+        generated_paths.append(str(output_file))
 
     # Create metadata file
     if generated_paths:
@@ -470,8 +919,17 @@ Examples:
         action="store_true",
         help="Disable EMA smoothing (shows only raw lines)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to render plots (default: 1, serial; "
+             "worth raising only when plotting many metrics)"
+    )
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     # Parse metrics
     metrics_list = [m.strip() for m in args.metrics.split(',') if m.strip()] if args.metrics else []
@@ -503,7 +961,8 @@ Examples:
             viewport_scale=args.viewport_scale,
             group_by_prefix=args.group_by_prefix,
             all_metrics=args.all_metrics,
-            include_system=args.include_system
+            include_system=args.include_system,
+            workers=args.workers
         )
 
         if generated:
@@ -8,18 +8,28 @@ about each metric (min, max, count, data type).
 import argparse
 import json
 import logging
+import numbers
 import sys
-from typing import Dict, Any
+from collections import Counter
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from scripts.wandb_utils import get_run, setup_logging, WandBAuthError
 
+# Column name prefixes treated as system metrics
+SYSTEM_PREFIXES = ('_', 'system/', 'gradients/')
+# Sampled history points fetched for statistics (the W&B default)
+DEFAULT_SAMPLES = 500
+
 
 def list_metrics(
     entity_project: str,
     run_id: str,
-    include_system: bool = False
+    include_system: bool = False,
+    with_stats: bool = True,
+    samples: int = DEFAULT_SAMPLES
 ) -> Dict[str, Dict[str, Any]]:
     """
     List available metrics for a run with statistics.
@@ -28,6 +38,9 @@ def list_metrics(
         entity_project: Project in format "entity/project" or "project"
         run_id: Run ID or name
         include_system: If True, include system columns (_step, _timestamp, etc.)
+        with_stats: If False, only list metric names and types from the run
+            summary, without fetching sampled history
+        samples: Number of sampled history points used for statistics
 
     Returns:
         Dict mapping metric names to statistics:
@@ -40,6 +53,7 @@ def list_metrics(
                 "type": str
             }
         }
+        Without stats, each entry only has "type".
 
     Raises:
         WandBAuthError: If not authenticated
@@ -53,9 +67,11 @@ def list_metrics(
     logger = logging.getLogger(__name__)
     run = get_run(entity_project, run_id)
 
+    if not with_stats:
+        return _list_metric_types(run, include_system)
+
     try:
-        # Get sampled history (typically ~500 points)
-        history_df = run.history()
+        history_df = run.history(samples=samples)
     except Exception as e:
         raise ValueError(f"Error fetching run history: {str(e)}") from e
 
@@ -68,54 +84,167 @@ def list_metrics(
 
     if not include_system:
         # Filter out system columns
-        system_prefixes = ('_', 'system/', 'gradients/')
-        columns = [col for col in columns
-                  if not any(col.startswith(prefix) for prefix in system_prefixes)]
+        columns = [col for col in columns if not col.startswith(SYSTEM_PREFIXES)]
+
+    # Calculate statistics for all metrics at once
+    history_df = history_df[columns]
+    column_types = _column_types(history_df, columns)
+    numeric_columns = [col for col in columns if column_types[col] == "numeric"]
+    numeric_stats = _numeric_stats(history_df, numeric_columns)
+    # Numeric counts come with the statistics; only the rest need a mask
+    non_null_counts = {col: stats.pop("non_null_count") for col, stats in numeric_stats.items()}
+    other_columns = [col for col in columns if col not in non_null_counts]
+    if other_columns:
+        non_null_counts.update(history_df[other_columns].notna().sum().items())
+    row_count = len(history_df)
 
-    # Calculate statistics for each metric
     metrics_info = {}
-
     for col in columns:
-        series = history_df[col]
-
-        # Skip if all null
-        if series.isna().all():
+        if not non_null_counts[col]:
+            # Skip if all null
             continue
-
-        # Determine data type
-        dtype = str(series.dtype)
-        if pd.api.types.is_numeric_dtype(series):
-            data_type = "numeric"
-        elif pd.api.types.is_string_dtype(series):
-            data_type = "string"
-        elif pd.api.types.is_bool_dtype(series):
-            data_type = "boolean"
-        else:
-            data_type = dtype
-
-        # Calculate statistics
         stats = {
-            "type": data_type,
-            "count": len(series),
-            "non_null_count": series.notna().sum(),
+            "type": column_types[col],
+            "count": row_count,
+            "non_null_count": int(non_null_counts[col]),
         }
-
-        # Add numeric statistics if applicable
-        if pd.api.types.is_numeric_dtype(series):
-            try:
-                stats["min"] = float(series.min())
-                stats["max"] = float(series.max())
-                stats["mean"] = float(series.mean())
-                stats["std"] = float(series.std())
-            except (ValueError, TypeError):
-                pass
-
+        stats.update(numeric_stats.get(col, {}))
         metrics_info[col] = stats
 
     logger.info("Found %d metric(s) in run %s", len(metrics_info), run_id)
     return metrics_info
 
 
+def _list_metric_types(run, include_system: bool) -> Dict[str, Dict[str, Any]]:
+    """List metric names and types without downloading sampled history.
+
+    The run summary holds the last logged value of every metric and is loaded
+    with the run, so it usually answers this with no further requests. Only
+    when it has no metrics is a one-row history probe fetched instead.
+    """
+    logger = logging.getLogger(__name__)
+
+    def keep(name: str) -> bool:
+        return include_system or not name.startswith(SYSTEM_PREFIXES)
+
+    summary = dict(run.summary.items()) if run.summary else {}
+    metrics_info = {
+        name: {"type": _value_type(value)}
+        for name, value in summary.items()
+        if value is not None and keep(name)
+    }
+
+    if not metrics_info:
+        try:
+            probe_df = run.history(samples=1)
+        except Exception as e:
+            raise ValueError(f"Error fetching run history: {str(e)}") from e
+        columns = [col for col in probe_df.columns if keep(col) and probe_df[col].notna().any()]
+        column_types = _column_types(probe_df, columns)
+        metrics_info = {col: {"type": column_types[col]} for col in columns}
+
+    logger.info("Found %d metric(s) in run %s", len(metrics_info), run.id)
+    return metrics_info
+
+
+def _value_type(value: Any) -> str:
+    """Classify a single logged value like the column types in list_metrics."""
+    if isinstance(value, numbers.Number):
+        return "numeric"
+    if isinstance(value, str):
+        return "string"
+    return "object"
+
+
+def _numeric_stats(history_df: pd.DataFrame, columns: List[str]) -> Dict[str, Dict[str, float]]:
+    """Compute non-null counts and min/max/mean/std for numeric columns.
+
+    Real-valued columns are reduced together as one float64 matrix; anything
+    that cannot be represented that way goes through pandas instead.
+    """
+    if not columns:
+        return {}
+    numeric_df = history_df[columns]
+    if not any(dtype.kind == "c" for dtype in numeric_df.dtypes if isinstance(dtype, np.dtype)):
+        try:
+            matrix = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            matrix = None
+        if matrix is not None:
+            table = _matrix_stats(matrix)
+            counts = table.pop("non_null_count")
+            return {
+                col: {
+                    "non_null_count": int(counts[idx]),
+                    **{name: float(values[idx]) for name, values in table.items()},
+                }
+                for idx, col in enumerate(columns)
+            }
+
+    reductions = ["min", "max", "mean", "std"]
+    stats = {}
+    for col in columns:
+        series = numeric_df[col]
+        stats[col] = {"non_null_count": int(series.notna().sum())}
+        try:
+            values = series.agg(reductions)
+            stats[col].update({name: float(values[name]) for name in reductions})
+        except (ValueError, TypeError):
+            pass
+    return stats
+
+
+def _matrix_stats(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """Column-wise non-NaN count and NaN-skipping min/max/mean/std (ddof=1).
+
+    Every reduction runs over all columns at once; std is computed from
+    deviations about the mean rather than from a sum of squares, which
+    loses precision for large values.
+    """
+    present = ~np.isnan(matrix)
+    counts = present.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(present, matrix, 0.0).sum(axis=0) / counts
+        deviations = np.where(present, matrix - mean, 0.0)
+        std = np.sqrt((deviations * deviations).sum(axis=0) / (counts - 1))
+    return {
+        "non_null_count": counts,
+        "min": np.where(present, matrix, np.inf).min(axis=0),
+        "max": np.where(present, matrix, -np.inf).max(axis=0),
+        "mean": mean,
+        "std": std,
+    }
+
+
+def _column_types(history_df: pd.DataFrame, columns: List[str]) -> Dict[str, str]:
+    """Classify columns as "numeric", "string", "boolean" or their dtype name.
+
+    Each distinct dtype is classified once; only object columns, whose type
+    depends on their values, are inspected individually.
+    """
+    types_by_dtype: Dict[Any, str] = {}
+    column_types = {}
+    for col, dtype in history_df[columns].dtypes.items():
+        if dtype == object:
+            column_types[col] = _kind_of(history_df[col])
+            continue
+        if dtype not in types_by_dtype:
+            types_by_dtype[dtype] = _kind_of(dtype)
+        column_types[col] = types_by_dtype[dtype]
+    return column_types
+
+
+def _kind_of(dtype_or_series: Any) -> str:
+    """Classify a dtype (or an object Series by its values)."""
+    if pd.api.types.is_numeric_dtype(dtype_or_series):
+        return "numeric"
+    if pd.api.types.is_string_dtype(dtype_or_series):
+        return "string"
+    if pd.api.types.is_bool_dtype(dtype_or_series):
+        return "boolean"
+    return str(dtype_or_series.dtype if isinstance(dtype_or_series, pd.Series) else dtype_or_series)
+
+
 def format_metrics_table(metrics: Dict[str, Dict[str, Any]]) -> str:
     """
     Format metrics as a human-readable table.
@@ -133,43 +262,29 @@ def format_metrics_table(metrics: Dict[str, Dict[str, Any]]) -> str:
     name_width = max(len(name) for name in metrics.keys()) + 2
     name_width = max(name_width, 25)
 
-    # Create header
-    header = f"{'Metric':<{name_width}} {'Type':<12} {'Count':<8} {'Min':<12} {'Max':<12} {'Mean':<12}"
+    # One format string shared by the header and every row
+    row_format = f"{{:<{name_width}}} {{:<12}} {{:<8}} {{:<12}} {{:<12}} {{:<12}}"
+    header = row_format.format("Metric", "Type", "Count", "Min", "Max", "Mean")
     separator = "-" * (name_width + 12 + 8 + 12 + 12 + 12)
 
-    lines = [header, separator]
-
     # Sort metrics by name for consistent output
-    sorted_metrics = sorted(metrics.items())
-
-    # Add rows
-    for name, stats in sorted_metrics:
-        data_type = stats.get("type", "unknown")
-        count = stats.get("non_null_count", stats.get("count", 0))
-
-        # Format numeric statistics
-        if "min" in stats and "max" in stats:
-            min_val = f"{stats['min']:.6g}"
-            max_val = f"{stats['max']:.6g}"
-            mean_val = f"{stats['mean']:.6g}" if "mean" in stats else "N/A"
-        else:
-            min_val = "N/A"
-            max_val = "N/A"
-            mean_val = "N/A"
-
-        row = f"{name:<{name_width}} {data_type:<12} {count:<8} {min_val:<12} {max_val:<12} {mean_val:<12}"
-        lines.append(row)
+    lines = [header, separator]
+    lines.extend(
+        row_format.format(
+            name,
+            stats.get("type", "unknown"),
+            stats.get("non_null_count", stats.get("count", "N/A")),
+            *_format_stats(stats)
+        )
+        for name, stats in sorted(metrics.items())
+    )
 
     # Add summary
     lines.append("")
     lines.append(f"Total metrics: {len(metrics)}")
 
     # Group by type
-    type_counts = {}
-    for stats in metrics.values():
-        dtype = stats.get("type", "unknown")
-        type_counts[dtype] = type_counts.get(dtype, 0) + 1
-
+    type_counts = Counter(stats.get("type", "unknown") for stats in metrics.values())
     if type_counts:
         type_summary = ", ".join(f"{dtype}: {count}" for dtype, count in sorted(type_counts.items()))
         lines.append(f"By type: {type_summary}")
@@ -177,6 +292,14 @@ def format_metrics_table(metrics: Dict[str, Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+def _format_stats(stats: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Format a metric's min, max and mean for the table ("N/A" when absent)."""
+    if "min" not in stats or "max" not in stats:
+        return "N/A", "N/A", "N/A"
+    mean = format(stats["mean"], ".6g") if "mean" in stats else "N/A"
+    return format(stats["min"], ".6g"), format(stats["max"], ".6g"), mean
+
+
 def main():
     """Main entry point for the script."""
     setup_logging()
@@ -191,6 +314,9 @@ Examples:
   # Include system metrics
   %(prog)s my-org/my-project abc123 --include-system
 
+  # Quickly list metric names and types only
+  %(prog)s my-org/my-project abc123 --no-stats
+
   # Get JSON output
   %(prog)s my-org/my-project abc123 --json
         """
@@ -209,6 +335,17 @@ Examples:
         action="store_true",
         help="Include system columns (_step, _timestamp, etc.)"
     )
+    parser.add_argument(
+        "--no-stats",
+        action="store_true",
+        help="Only list metric names and types from the run summary (skips fetching history)"
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help=f"Sampled history points used for statistics (default: {DEFAULT_SAMPLES})"
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -216,13 +353,17 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
 
     try:
         # Get metrics
         metrics = list_metrics(
             args.entity_project,
             args.run_id,
-            include_system=args.include_system
+            include_system=args.include_system,
+            with_stats=not args.no_stats,
+            samples=args.samples
         )
 
         # Output results
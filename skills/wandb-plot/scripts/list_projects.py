@@ -2,6 +2,7 @@
 """List W&B projects for an entity with optional formatting."""
 
 import argparse
+import io
 import json
 import logging
 import sys
@@ -9,10 +10,13 @@ from typing import List, Dict, Optional
 
 from scripts.wandb_utils import (
     get_api,
+    get_default_entity,
     setup_logging,
     WandBAuthError,
 )
 
+MAX_PAGE_SIZE = 100
+
 
 def list_projects(
     entity: Optional[str] = None,
@@ -36,17 +40,14 @@ def list_projects(
     api = get_api()
 
     if not entity:
-        viewer = api.viewer
-        if isinstance(viewer, dict):
-            entity = viewer.get("entity") or viewer.get("username")
-        else:
-            entity = getattr(viewer, "entity", None) or getattr(viewer, "username", None)
+        entity = get_default_entity(api)
 
     if not entity:
         raise ValueError("Could not determine default entity. Please pass --entity.")
 
     try:
-        projects_iterator = api.projects(entity)
+        # Size pages to the limit so small limits fetch a single page
+        projects_iterator = api.projects(entity, per_page=max(1, min(limit, MAX_PAGE_SIZE)))
     except Exception as e:
         raise ValueError(
             f"Error accessing projects for entity '{entity}': {str(e)}\n"
@@ -94,23 +95,25 @@ def format_project_table(projects: List[Dict]) -> str:
     name_width = max(len(p["name"] or "") for p in projects) + 2
     name_width = max(name_width, 24)
 
-    header = f"{'Name':<{name_width}} {'Created':<20} {'Description'}"
-    separator = "-" * (name_width + 20 + 40)
-    lines = [header, separator]
+    buf = io.StringIO()
+    buf.write(f"{'Name':<{name_width}} {'Created':<20} {'Description'}\n")
+    buf.write("-" * (name_width + 20 + 40))
 
     for project in projects:
         created_str = project["created_at"][:19] if project["created_at"] else "N/A"
         description = project.get("description") or ""
         if len(description) > 80:
             description = f"{description[:77]}..."
-        lines.append(
-            f"{project['name']:<{name_width}} {created_str:<20} {description}"
-        )
+        buf.write("\n")
+        buf.write((project["name"] or "").ljust(name_width))
+        buf.write(" ")
+        buf.write(created_str.ljust(20))
+        buf.write(" ")
+        buf.write(description)
 
-    lines.append("")
-    lines.append(f"Total: {len(projects)} projects")
+    buf.write(f"\n\nTotal: {len(projects)} projects")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main() -> int:
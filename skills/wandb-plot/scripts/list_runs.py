@@ -6,18 +6,28 @@ by state and limit the number of results.
 """
 
 import argparse
-import json
 import logging
 import sys
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, List, Dict, Optional
 
 from scripts.wandb_utils import (
+    dumps_json,
     get_api,
     parse_entity_project,
     setup_logging,
     WandBAuthError,
 )
 
+# Largest page requested from the runs endpoint
+MAX_PAGE_SIZE = 100
+# Summary metrics shown per run in the table
+SUMMARY_METRICS_SHOWN = 3
+# Threads resolving run details; lazily listed runs fetch their summary
+# with one request each, so these overlap on network latency
+RUN_DETAIL_WORKERS = 8
+
 
 def list_runs(
     entity_project: str,
@@ -54,9 +64,12 @@ def list_runs(
         filters["state"] = state
 
     try:
+        # Size the first page to the limit so small listings need one request
         runs_iterator = api.runs(
             f"{entity}/{project}",
-            filters=filters if filters else None
+            filters=filters if filters else None,
+            order="+created_at",
+            per_page=max(1, min(limit, MAX_PAGE_SIZE))
         )
     except Exception as e:
         raise ValueError(
@@ -67,64 +80,66 @@ def list_runs(
             f"  3. The entity/project path is correct"
         ) from e
 
-    # Collect run info
-    runs_list = []
-    count = 0
-
-    for run in runs_iterator:
-        if count >= limit:
-            break
-
-        run_info = {
-            "id": run.id,
-            "name": run.name,
-            "state": run.state,
-            "created_at": (
-                run.created_at.isoformat()
-                if hasattr(run.created_at, "isoformat")
-                else (str(run.created_at) if run.created_at is not None else None)
-            ),
-            "summary_metrics": to_json_friendly(run.summary) if run.summary else {},
-            "tags": run.tags if hasattr(run, 'tags') else [],
-        }
-
-        runs_list.append(run_info)
-        count += 1
+    # islice stops before the iterator fetches another page
+    raw_runs = list(islice(runs_iterator, max(limit, 0)))
+    if len(raw_runs) > 1:
+        workers = min(RUN_DETAIL_WORKERS, len(raw_runs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            runs_list = list(executor.map(_build_run_info, raw_runs))
+    else:
+        runs_list = [_build_run_info(run) for run in raw_runs]
 
     logger.info("Found %d run(s) in %s/%s", len(runs_list), entity, project)
     return runs_list
 
 
-def to_json_friendly(value):
-    """Convert W&B summary values into JSON-serializable types."""
-    if value is None or isinstance(value, (str, int, float, bool)):
-        return value
-    try:
-        items = value.items()
-    except Exception:
-        items = None
-    if items is not None:
-        return {str(k): to_json_friendly(v) for k, v in items}
-    if isinstance(value, (list, tuple, set)):
-        return [to_json_friendly(v) for v in value]
-    try:
-        isoformat = value.isoformat
-    except Exception:
-        isoformat = None
-    if callable(isoformat):
-        try:
-            return isoformat()
-        except Exception:
-            pass
-    try:
-        item = value.item
-    except Exception:
-        item = None
-    if callable(item):
-        try:
-            return item()
-        except Exception:
-            pass
+def _build_run_info(run: Any) -> Dict[str, Any]:
+    """Build the listing entry for one run.
+
+    Reading ``run.summary`` may trigger a GraphQL request when the run was
+    listed lazily, which is why list_runs calls this from a thread pool.
+    """
+    created_at = run.created_at
+    summary = run.summary
+    return {
+        "id": run.id,
+        "name": run.name,
+        "state": run.state,
+        "created_at": (
+            created_at.isoformat()
+            if hasattr(created_at, "isoformat")
+            else (str(created_at) if created_at is not None else None)
+        ),
+        # Nested values are converted lazily by json_default when encoded
+        "summary_metrics": dict(summary.items()) if summary else {},
+        "tags": run.tags if hasattr(run, 'tags') else [],
+    }
+
+
+def json_default(value: Any) -> Any:
+    """JSON encoder hook for W&B summary values the encoder cannot serialize.
+
+    Only called for non-native values (summary sub-dicts, datetimes, numpy
+    scalars and the like); everything else is encoded directly.
+
+    Args:
+        value: Value the encoder could not serialize
+
+    Returns:
+        A JSON-serializable replacement (falling back to ``str(value)``)
+    """
+    items = getattr(value, "items", None)
+    if callable(items):
+        return {str(k): v for k, v in items()}
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    for attr in ("isoformat", "tolist", "item"):
+        method = getattr(value, attr, None)
+        if callable(method):
+            try:
+                return method()
+            except Exception:
+                pass
     return str(value)
 
 
@@ -141,15 +156,20 @@ def format_run_table(runs: List[Dict]) -> str:
     if not runs:
         return "No runs found."
 
-    # Calculate column widths
-    id_width = max(len(run["id"]) for run in runs) + 2
-    name_width = max(len(run["name"]) for run in runs) + 2
-    state_width = max(len(run["state"]) for run in runs) + 2
+    # Calculate column widths and per-state counts in one pass over the runs
+    id_len = name_len = state_len = 0
+    state_counts = {}
+    for run in runs:
+        state = run["state"]
+        id_len = max(id_len, len(run["id"]))
+        name_len = max(name_len, len(run["name"]))
+        state_len = max(state_len, len(state))
+        state_counts[state] = state_counts.get(state, 0) + 1
 
-    # Ensure minimum widths
-    id_width = max(id_width, 12)
-    name_width = max(name_width, 20)
-    state_width = max(state_width, 12)
+    # Pad each column and ensure minimum widths
+    id_width = max(id_len + 2, 12)
+    name_width = max(name_len + 2, 20)
+    state_width = max(state_len + 2, 12)
 
     # Create header
     header = f"{'ID':<{id_width}} {'Name':<{name_width}} {'State':<{state_width}} {'Created':<20} {'Summary Metrics'}"
@@ -165,11 +185,14 @@ def format_run_table(runs: List[Dict]) -> str:
         # Format summary metrics (show first 3)
         metrics = run.get("summary_metrics", {})
         if metrics:
-            metric_strs = [f"{k}={v:.4f}" if isinstance(v, float) else f"{k}={v}"
-                          for k, v in list(metrics.items())[:3]]
-            metrics_str = ", ".join(metric_strs)
-            if len(metrics) > 3:
-                metrics_str += f" (+{len(metrics) - 3} more)"
+            # Only the first few items are needed, so avoid listing them all
+            metrics_str = ", ".join(
+                f"{k}={format(v, '.4f') if isinstance(v, float) else v}"
+                for k, v in islice(metrics.items(), SUMMARY_METRICS_SHOWN)
+            )
+            hidden = len(metrics) - SUMMARY_METRICS_SHOWN
+            if hidden > 0:
+                metrics_str += f" (+{hidden} more)"
         else:
             metrics_str = "None"
 
@@ -177,11 +200,6 @@ def format_run_table(runs: List[Dict]) -> str:
         lines.append(row)
 
     # Add summary statistics
-    state_counts = {}
-    for run in runs:
-        state = run["state"]
-        state_counts[state] = state_counts.get(state, 0) + 1
-
     lines.append("")
     lines.append(f"Total: {len(runs)} runs")
     if state_counts:
@@ -245,7 +263,7 @@ Examples:
 
         # Output results
         if args.json:
-            print(json.dumps(runs, indent=2))
+            print(dumps_json(runs, default=json_default).decode("utf-8"))
         else:
             print(format_run_table(runs))
 
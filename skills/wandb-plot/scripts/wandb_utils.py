@@ -4,16 +4,34 @@ This module provides authentication, run retrieval, and directory management
 utilities for interacting with Weights & Biases.
 """
 
+import functools
 import logging
+import operator
 import os
 import json
+import weakref
 from pathlib import Path
-from typing import Tuple, Optional, Iterable, TypeVar, Any, Dict
+from typing import Tuple, Optional, Iterable, TypeVar, Any, Callable, Dict
+import requests
 import wandb
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from wandb.apis.public import Run
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup for metadata serialization
+    orjson = None
+
+try:
+    from tqdm import tqdm as _tqdm  # type: ignore
+except ImportError:  # progress bars are optional
+    _tqdm = None
+
 T = TypeVar("T")
 
+_DEFAULT_ENTITIES: "weakref.WeakKeyDictionary[Any, Optional[str]]" = weakref.WeakKeyDictionary()
+
 
 class WandBAuthError(Exception):
     """Raised when W&B authentication fails."""
@@ -38,9 +56,14 @@ def setup_logging():
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
+@functools.lru_cache(maxsize=1)
 def get_api() -> wandb.Api:
     """Initialize W&B API with proper authentication.
 
+    The instance is memoized for the lifetime of the process so every caller
+    (run lookups, project and run listings) shares one client and its HTTP
+    session. Failed initializations are not cached.
+
     Returns:
         wandb.Api: Authenticated W&B API instance
 
@@ -62,6 +85,8 @@ def get_api() -> wandb.Api:
         else:
             username = getattr(viewer, "username", None)
         logger.debug("W&B API initialized for user: %s", username)
+        # Remember the viewer's entity now so later lookups skip api.viewer
+        _cache_default_entity(api, _viewer_entity(viewer))
         return api
     except wandb.errors.UsageError as e:
         if "Could not find" in str(e) or "login" in str(e).lower():
@@ -76,6 +101,65 @@ def get_api() -> wandb.Api:
         raise
 
 
+def mount_pooled_adapter(
+    session: requests.Session,
+    pool_connections: int,
+    pool_maxsize: int,
+    backoff_factor: float = 0.5,
+) -> requests.Session:
+    """Mount a keep-alive, retrying HTTP adapter on a requests session.
+
+    Args:
+        session: Session to configure in place
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept open per host
+        backoff_factor: Retry backoff factor passed to urllib3
+
+    Returns:
+        requests.Session: The same session, for chaining
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=backoff_factor),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_default_entity(api: wandb.Api) -> Optional[str]:
+    """Return the current viewer's entity (or username), resolved once per API instance.
+
+    Accessing ``api.viewer`` may trigger a GraphQL round-trip, and the result
+    is stable for the lifetime of the process, so it is cached per API object.
+    """
+    try:
+        return _DEFAULT_ENTITIES[api]
+    except (KeyError, TypeError):
+        pass
+
+    entity = _viewer_entity(api.viewer)
+    _cache_default_entity(api, entity)
+    return entity
+
+
+def _viewer_entity(viewer: Any) -> Optional[str]:
+    """Extract the entity (falling back to username) from viewer info."""
+    if isinstance(viewer, dict):
+        return viewer.get("entity") or viewer.get("username")
+    return getattr(viewer, "entity", None) or getattr(viewer, "username", None)
+
+
+def _cache_default_entity(api: wandb.Api, entity: Optional[str]) -> None:
+    """Store the default entity for an API instance when it can be weakly referenced."""
+    try:
+        _DEFAULT_ENTITIES[api] = entity
+    except TypeError:
+        # API object is not weak-referenceable; skip caching
+        pass
+
+
 def parse_entity_project(
     entity_project: str,
     api: Optional[wandb.Api] = None,
@@ -106,31 +190,37 @@ def parse_entity_project(
     if not entity_project or not entity_project.strip():
         raise ValueError("entity_project cannot be empty")
 
-    entity_project = entity_project.strip()
-
-    if "/" in entity_project:
-        parts = entity_project.split("/")
-        if len(parts) != 2:
-            raise ValueError(
-                f"Invalid format '{entity_project}'. "
-                "Expected 'entity/project' or 'project'"
-            )
-        entity, project = parts
-        if not entity or not project:
-            raise ValueError(
-                f"Invalid format '{entity_project}'. "
-                "Entity and project cannot be empty"
-            )
-        return entity.strip(), project.strip()
-    else:
+    entity, project = _split_entity_project(entity_project.strip())
+    if entity is None:
         # Only project provided, use current user's entity
         api = api or get_api()
-        viewer = api.viewer
-        if isinstance(viewer, dict):
-            entity = viewer.get("entity") or viewer.get("username")
-        else:
-            entity = getattr(viewer, "entity", None) or getattr(viewer, "username", None)
-        return entity, entity_project
+        entity = get_default_entity(api)
+    return entity, project
+
+
+@functools.lru_cache(maxsize=32)
+def _split_entity_project(entity_project: str) -> Tuple[Optional[str], str]:
+    """Split a stripped "entity/project" or "project" string (entity None if absent).
+
+    Memoized because every script parses the same CLI argument several times;
+    the default entity lookup stays in parse_entity_project.
+    """
+    if "/" not in entity_project:
+        return None, entity_project
+
+    parts = entity_project.split("/")
+    if len(parts) != 2:
+        raise ValueError(
+            f"Invalid format '{entity_project}'. "
+            "Expected 'entity/project' or 'project'"
+        )
+    entity, project = parts
+    if not entity or not project:
+        raise ValueError(
+            f"Invalid format '{entity_project}'. "
+            "Entity and project cannot be empty"
+        )
+    return entity.strip(), project.strip()
 
 
 def get_run(entity_project: str, run_id: str) -> Run:
@@ -208,27 +298,7 @@ def ensure_output_dir(
         wandb_plots/my-org_my-project/experiment-1_abc123
     """
     entity, project = parse_entity_project(entity_project)
-
-    # Create project directory name
-    project_dir = f"{entity}_{project}"
-
-    # Create run directory name
-    if run_name:
-        run_dir = f"{run_name}_{run_id}"
-    else:
-        run_dir = run_id
-
-    # Construct full path
-    output_path = Path(base_dir) / project_dir / run_dir
-
-    # Create directory
-    try:
-        output_path.mkdir(parents=True, exist_ok=True)
-        return output_path
-    except OSError as e:
-        raise OSError(
-            f"Failed to create output directory '{output_path}': {str(e)}"
-        ) from e
+    return _make_output_dir(entity, project, run_id, run_name, base_dir)
 
 
 def ensure_output_dir_from_parts(
@@ -241,17 +311,30 @@ def ensure_output_dir_from_parts(
     """Create and return organized output directory for a run, without API calls."""
     if not entity or not project:
         raise ValueError("entity and project are required")
+    return _make_output_dir(entity, project, run_id, run_name, base_dir)
 
-    project_dir = f"{entity}_{project}"
+
+def _make_output_dir(
+    entity: str,
+    project: str,
+    run_id: str,
+    run_name: Optional[str],
+    base_dir: str,
+) -> Path:
+    """Create {base_dir}/{entity}_{project}/{run_name}_{run_id} and return it."""
     run_dir = f"{run_name}_{run_id}" if run_name else run_id
-    output_path = Path(base_dir) / project_dir / run_dir
+    output_path = os.path.join(base_dir, f"{entity}_{project}", run_dir)
     try:
-        output_path.mkdir(parents=True, exist_ok=True)
-        return output_path
+        os.makedirs(output_path, exist_ok=True)
     except OSError as e:
         raise OSError(
             f"Failed to create output directory '{output_path}': {str(e)}"
         ) from e
+    return Path(output_path)
+
+
+# Run attributes used to build output paths, fetched in one call
+_RUN_PATH_ATTRS = operator.attrgetter("entity", "project", "id", "name")
 
 
 def resolve_output_dir(
@@ -266,10 +349,13 @@ def resolve_output_dir(
         output_path.mkdir(parents=True, exist_ok=True)
         return output_path
 
-    entity = getattr(run, "entity", None)
-    project = getattr(run, "project", None)
-    run_id = getattr(run, "id", None)
-    run_name = getattr(run, "name", None)
+    try:
+        entity, project, run_id, run_name = _RUN_PATH_ATTRS(run)
+    except AttributeError:
+        # Partial run objects: take whatever attributes exist
+        entity, project, run_id, run_name = (
+            getattr(run, name, None) for name in ("entity", "project", "id", "name")
+        )
     if entity and project and run_id:
         return ensure_output_dir_from_parts(
             entity=str(entity),
@@ -284,20 +370,50 @@ def resolve_output_dir(
     return ensure_output_dir(entity_project, run_id=str(run_id), run_name=str(run_name) if run_name else None, base_dir=base_dir)
 
 
-def progress_wrap(items: Iterable[T], desc: str) -> Iterable[T]:
-    """Provide optional tqdm progress without a hard dependency."""
-    try:
-        from tqdm import tqdm  # type: ignore
-    except Exception:
+def progress_wrap(items: Iterable[T], desc: str, **tqdm_kwargs: Any) -> Iterable[T]:
+    """Provide optional tqdm progress without a hard dependency.
+
+    Extra keyword arguments (e.g. ``mininterval``/``miniters`` to throttle
+    refreshes on long iterators) are passed to tqdm.
+    """
+    if _tqdm is None:
         return items
-    return tqdm(items, desc=desc)
+    return _tqdm(items, desc=desc, **tqdm_kwargs)
+
+
+# Path separators replaced by safe_filename, in one translate() pass
+_SAFE_FILENAME_TABLE = str.maketrans({"/": "_", "\\": "_"})
 
 
 def safe_filename(name: str) -> str:
     """Convert a metric/file label into a filesystem-safe filename."""
     if not name:
         return "unnamed"
-    return name.replace("/", "_").replace("\\", "_")
+    return name.translate(_SAFE_FILENAME_TABLE)
+
+
+def dumps_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed.
+
+    Args:
+        data: Value to serialize
+        default: Optional hook called for values the encoder cannot serialize;
+            it should return a serializable replacement
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            # Fall back for values orjson does not handle (e.g. non-str keys)
+            pass
+    return json.dumps(data, indent=2, default=default).encode("utf-8")
 
 
 def write_metadata_json(
@@ -306,24 +422,38 @@ def write_metadata_json(
     filename: str = "metadata.json",
     merge: bool = True,
 ) -> None:
-    """Write metadata JSON into the output directory, optionally merging with existing."""
+    """Write metadata JSON into the output directory, optionally merging with existing.
+
+    The file is replaced atomically, so an interrupted write leaves the
+    previous metadata in place.
+    """
     logger = logging.getLogger(__name__)
     metadata_path = output_path / filename
 
     if merge and metadata_path.exists():
         try:
-            with open(metadata_path, "r") as f:
-                existing = json.load(f)
+            with open(metadata_path, "rb") as f:
+                raw = f.read()
+            existing = orjson.loads(raw) if orjson is not None else json.loads(raw)
             if isinstance(existing, dict):
                 metadata = {**existing, **metadata}
         except Exception:
             pass
 
+    # Serialize first, then write a temporary file and rename it over the
+    # target so readers never see a truncated or half-written file
+    data = dumps_json(metadata)
+    tmp_path = metadata_path.with_name(f".{filename}.{os.getpid()}.tmp")
     try:
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, metadata_path)
     except OSError as e:
         logger.warning("Failed to write metadata file %s: %s", metadata_path, e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
 
 def format_entity_project(entity: str, project: str) -> str:
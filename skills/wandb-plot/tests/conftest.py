@@ -1,11 +1,30 @@
 """Shared pytest fixtures for W&B Plot Skill tests."""
 
+import os
+
 import pytest
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from unittest.mock import Mock
 
+from scripts.wandb_utils import get_api
+
+
+@pytest.fixture(autouse=True)
+def clear_api_cache():
+    """Reset the memoized W&B API instance between tests."""
+    get_api.cache_clear()
+    yield
+    get_api.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def wandb_network():
+    """Skip tests that need the live W&B API when no API key is configured."""
+    if not os.getenv("WANDB_API_KEY"):
+        pytest.skip("No W&B API key")
+
 
 @pytest.fixture
 def mock_wandb_api(mocker):
@@ -30,20 +49,23 @@ def mock_run(mocker):
     return run
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metrics_data():
-    """Sample metrics data for testing plot generation."""
-    np.random.seed(42)  # For reproducibility
+    """Sample metrics data for testing plot generation.
+
+    Built once per session; tests that modify it must work on a copy.
+    """
+    rng = np.random.default_rng(42)  # For reproducibility
     n_points = 100
 
     return pd.DataFrame({
-        '_step': range(n_points),
-        '_timestamp': range(n_points),
-        'loss': np.random.random(n_points) * 2,  # Random loss values
-        'accuracy': np.random.random(n_points) * 0.5 + 0.5,  # 0.5-1.0 range
-        'learning_rate': [0.001] * n_points,  # Constant value
-        'val_loss': np.random.random(n_points) * 2.5,
-        'val_accuracy': np.random.random(n_points) * 0.4 + 0.6,
+        '_step': np.arange(n_points),
+        '_timestamp': np.arange(n_points),
+        'loss': rng.random(n_points) * 2,  # Random loss values
+        'accuracy': rng.random(n_points) * 0.5 + 0.5,  # 0.5-1.0 range
+        'learning_rate': np.full(n_points, 0.001),  # Constant value
+        'val_loss': rng.random(n_points) * 2.5,
+        'val_accuracy': rng.random(n_points) * 0.4 + 0.6,
     })
 
 
@@ -123,25 +145,61 @@ def mock_file():
     return file_mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_history_df():
-    """Sample history dataframe as returned by run.history()."""
-    np.random.seed(42)
+    """Sample history dataframe as returned by run.history().
+
+    Built once per session; tests that modify it must work on a copy.
+    """
+    rng = np.random.default_rng(42)
     n_points = 500  # run.history() typically returns ~500 points
+    decay = np.exp(-np.linspace(0, 3, n_points))
 
     return pd.DataFrame({
-        '_step': range(n_points),
+        '_step': np.arange(n_points),
         '_timestamp': np.linspace(1704067200, 1704070800, n_points),  # Unix timestamps
         '_runtime': np.linspace(0, 3600, n_points),  # Runtime in seconds
-        'epoch': np.repeat(range(10), 50),
-        'train/loss': np.exp(-np.linspace(0, 3, n_points)) + np.random.random(n_points) * 0.1,
-        'train/accuracy': 1 - np.exp(-np.linspace(0, 3, n_points)) * 0.5 + np.random.random(n_points) * 0.05,
-        'val/loss': np.exp(-np.linspace(0, 3, n_points)) + np.random.random(n_points) * 0.15,
-        'val/accuracy': 1 - np.exp(-np.linspace(0, 3, n_points)) * 0.5 + np.random.random(n_points) * 0.07,
+        'epoch': np.repeat(np.arange(10), 50),
+        'train/loss': decay + rng.random(n_points) * 0.1,
+        'train/accuracy': 1 - decay * 0.5 + rng.random(n_points) * 0.05,
+        'val/loss': decay + rng.random(n_points) * 0.15,
+        'val/accuracy': 1 - decay * 0.5 + rng.random(n_points) * 0.07,
         'learning_rate': np.linspace(0.001, 0.0001, n_points),
     })
 
 
+@pytest.fixture(scope="session")
+def sample_history_records(sample_history_df):
+    """sample_history_df as the row dicts run.scan_history() yields, built once."""
+    return sample_history_df.to_dict(orient="records")
+
+
+# Run attributes read by the plotting scripts; anything else raises on access
+RUN_MOCK_SPEC = ["id", "name", "entity", "project", "history", "scan_history"]
+
+
+@pytest.fixture(scope="session")
+def make_run_mock(sample_history_df, sample_history_records):
+    """Factory for run mocks serving sample_history_df from history() and scan_history().
+
+    Keyword arguments override the default attributes, e.g.
+    ``make_run_mock(id="run-aaa", name="test-run-a")``.
+    """
+    def _make(**overrides):
+        run = Mock(spec=RUN_MOCK_SPEC)
+        run.id = "run-123"
+        run.name = "test-run"
+        run.entity = "test-entity"
+        run.project = "test-project"
+        run.history.return_value = sample_history_df
+        run.scan_history.return_value = sample_history_records
+        for name, value in overrides.items():
+            setattr(run, name, value)
+        return run
+
+    return _make
+
+
 @pytest.fixture
 def mock_empty_run(mocker):
     """Mock W&B run with no metrics."""
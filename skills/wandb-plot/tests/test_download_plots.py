@@ -5,8 +5,9 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+import responses
 
-from scripts.download_plots import download_plots
+from scripts.download_plots import download_plots, download_plots_bulk, find_plot_files
 
 
 class TestDownloadPlots:
@@ -32,12 +33,9 @@ class TestDownloadPlots:
         run.entity = "test-entity"
         run.project = "test-project"
 
-        def files_side_effect(pattern=None):
-            if pattern == "media/images/*.png":
-                return [mock_file]
-            return []
-
-        run.files.side_effect = files_side_effect
+        other_file = Mock()
+        other_file.name = "output.log"
+        run.files.return_value = [mock_file, other_file, mock_file]
         mock_get_run.return_value = run
 
         downloaded = download_plots("test-entity/test-project", "run-123")
@@ -45,6 +43,8 @@ class TestDownloadPlots:
         assert len(downloaded) == 1
         assert Path(downloaded[0]).exists()
         assert (output_dir / "metadata.json").exists()
+        # Default patterns are matched locally against a single listing
+        run.files.assert_called_once_with()
 
     @patch("scripts.download_plots.get_run")
     @patch("scripts.download_plots.resolve_output_dir")
@@ -131,6 +131,8 @@ class TestDownloadPlots:
 
         assert len(downloaded) == 1
         mock_file.download.assert_not_called()
+        # Nothing new was downloaded, so metadata is left untouched
+        assert not (output_dir / "metadata.json").exists()
 
     @patch("scripts.download_plots.get_run")
     @patch("scripts.download_plots.resolve_output_dir")
@@ -200,3 +202,332 @@ class TestDownloadPlots:
         assert metadata["run_id"] == "run-123"
         assert metadata["file_count"] == 1
         assert metadata["files_downloaded"] == [Path(downloaded[0]).name]
+
+    @patch("scripts.download_plots.get_run")
+    @patch("scripts.download_plots.resolve_output_dir")
+    def test_parallel_download_preserves_order(
+        self,
+        mock_resolve_output_dir,
+        mock_get_run,
+        tmp_path
+    ):
+        """Test concurrent downloads keep listing order and isolate failures."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_resolve_output_dir.return_value = output_dir
+
+        def make_file(name, fail=False):
+            file_mock = Mock()
+            file_mock.name = name
+
+            def download_side_effect(root=None, replace=False):
+                if fail:
+                    raise RuntimeError("network error")
+                download_path = Path(root) / name
+                download_path.parent.mkdir(parents=True, exist_ok=True)
+                download_path.touch()
+                return str(download_path)
+
+            file_mock.download = Mock(side_effect=download_side_effect)
+            return file_mock
+
+        files = [make_file(f"media/images/plot_{i}.png") for i in range(5)]
+        files.append(make_file("media/images/broken.png", fail=True))
+
+        run = Mock()
+        run.id = "run-123"
+        run.name = "test-run"
+        run.entity = "test-entity"
+        run.project = "test-project"
+        run.files.return_value = files
+        mock_get_run.return_value = run
+
+        downloaded = download_plots(
+            "test-entity/test-project",
+            "run-123",
+            pattern="media/images/*.png",
+            concurrency=3
+        )
+
+        assert [Path(p).name for p in downloaded] == [f"plot_{i}.png" for i in range(5)]
+        assert all(Path(p).exists() for p in downloaded)
+        assert not (output_dir / "media").exists()
+
+    @patch("scripts.download_plots.get_run")
+    @patch("scripts.download_plots.resolve_output_dir")
+    def test_shared_basename_downloads_first_match_only(
+        self,
+        mock_resolve_output_dir,
+        mock_get_run,
+        tmp_path
+    ):
+        """Test files mapping to the same flat name are not downloaded concurrently."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_resolve_output_dir.return_value = output_dir
+
+        def make_file(name):
+            file_mock = Mock()
+            file_mock.name = name
+
+            def download_side_effect(root=None, replace=False):
+                download_path = Path(root) / name
+                download_path.parent.mkdir(parents=True, exist_ok=True)
+                download_path.write_text(name)
+                return str(download_path)
+
+            file_mock.download = Mock(side_effect=download_side_effect)
+            return file_mock
+
+        first = make_file("media/images/loss.png")
+        second = make_file("plots/loss.png")
+
+        run = Mock()
+        run.id = "run-123"
+        run.name = "test-run"
+        run.entity = "test-entity"
+        run.project = "test-project"
+        run.files.return_value = [first, second]
+        mock_get_run.return_value = run
+
+        downloaded = download_plots("test-entity/test-project", "run-123")
+
+        assert downloaded == [str(output_dir / "loss.png")]
+        assert (output_dir / "loss.png").read_text() == "media/images/loss.png"
+        second.download.assert_not_called()
+
+    @responses.activate
+    @patch("scripts.download_plots.get_run")
+    @patch("scripts.download_plots.resolve_output_dir")
+    def test_download_via_direct_url(
+        self,
+        mock_resolve_output_dir,
+        mock_get_run,
+        tmp_path
+    ):
+        """Test files with a direct URL are fetched over the shared session."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_resolve_output_dir.return_value = output_dir
+
+        direct_url = "https://storage.example.com/media/images/plot.png"
+        responses.add(responses.GET, direct_url, body=b"png-bytes", status=200)
+
+        file_mock = Mock()
+        file_mock.name = "media/images/plot.png"
+        file_mock.direct_url = direct_url
+
+        run = Mock()
+        run.id = "run-123"
+        run.name = "test-run"
+        run.entity = "test-entity"
+        run.project = "test-project"
+        run.files.return_value = [file_mock]
+        mock_get_run.return_value = run
+
+        downloaded = download_plots("test-entity/test-project", "run-123")
+
+        assert downloaded == [str(output_dir / "plot.png")]
+        assert (output_dir / "plot.png").read_bytes() == b"png-bytes"
+        file_mock.download.assert_not_called()
+
+    @responses.activate
+    @patch("scripts.download_plots.get_run")
+    @patch("scripts.download_plots.resolve_output_dir")
+    def test_direct_url_failure_falls_back_to_file_download(
+        self,
+        mock_resolve_output_dir,
+        mock_get_run,
+        mock_file,
+        tmp_path
+    ):
+        """Test a failed direct download falls back to file.download."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_resolve_output_dir.return_value = output_dir
+
+        direct_url = "https://storage.example.com/media/images/plot.png"
+        responses.add(responses.GET, direct_url, status=403)
+        mock_file.direct_url = direct_url
+
+        run = Mock()
+        run.id = "run-123"
+        run.name = "test-run"
+        run.entity = "test-entity"
+        run.project = "test-project"
+        run.files.return_value = [mock_file]
+        mock_get_run.return_value = run
+
+        downloaded = download_plots("test-entity/test-project", "run-123")
+
+        mock_file.download.assert_called_once_with(root=str(output_dir), replace=False)
+        assert downloaded == [str(output_dir / "plot.png")]
+        assert (output_dir / "plot.png").exists()
+
+    @responses.activate
+    @patch("scripts.download_plots.get_run")
+    @patch("scripts.download_plots.resolve_output_dir")
+    def test_failed_forced_download_keeps_existing_file(
+        self,
+        mock_resolve_output_dir,
+        mock_get_run,
+        tmp_path
+    ):
+        """Test a forced re-download that fails leaves the existing copy intact."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        (output_dir / "plot.png").write_bytes(b"old-png")
+        mock_resolve_output_dir.return_value = output_dir
+
+        direct_url = "https://storage.example.com/media/images/plot.png"
+        responses.add(responses.GET, direct_url, status=403)
+
+        file_mock = Mock()
+        file_mock.name = "media/images/plot.png"
+        file_mock.direct_url = direct_url
+        file_mock.download.side_effect = RuntimeError("network error")
+
+        run = Mock()
+        run.id = "run-123"
+        run.name = "test-run"
+        run.files.return_value = [file_mock]
+        mock_get_run.return_value = run
+
+        downloaded = download_plots("test-entity/test-project", "run-123", force=True)
+
+        assert downloaded == []
+        assert (output_dir / "plot.png").read_bytes() == b"old-png"
+        assert [p.name for p in output_dir.iterdir()] == ["plot.png"]
+
+    @patch("scripts.download_plots.get_run")
+    @patch("scripts.download_plots.resolve_output_dir")
+    def test_download_without_output_file_is_reported(
+        self,
+        mock_resolve_output_dir,
+        mock_get_run,
+        tmp_path
+    ):
+        """Test a download that writes nothing is reported as a failure."""
+        output_dir = tmp_path / "out"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        mock_resolve_output_dir.return_value = output_dir
+
+        file_mock = Mock()
+        file_mock.name = "media/images/plot.png"
+        file_mock.download = Mock(return_value=None)
+
+        run = Mock()
+        run.id = "run-123"
+        run.name = "test-run"
+        run.files.return_value = [file_mock]
+        mock_get_run.return_value = run
+
+        downloaded = download_plots("test-entity/test-project", "run-123")
+
+        assert downloaded == []
+        assert not (output_dir / "metadata.json").exists()
+
+
+class TestFindPlotFiles:
+    """Tests for find_plot_files function."""
+
+    @staticmethod
+    def make_files(count):
+        files = []
+        for i in range(count):
+            file_mock = Mock()
+            file_mock.name = f"media/images/plot_{i}.png"
+            files.append(file_mock)
+        return files
+
+    def test_single_pattern_is_not_capped(self):
+        """Test a server-side filtered pattern returns every match."""
+        run = Mock()
+        run.files.return_value = iter(self.make_files(5))
+
+        found = find_plot_files(run, ["media/images/*.png"], max_files=2)
+
+        assert len(found) == 5
+        run.files.assert_called_once_with(pattern="media/images/*.png")
+
+    def test_listing_cap_logs_warning(self, caplog):
+        """Test a listing truncated by max_files is reported."""
+        run = Mock()
+        run.files.return_value = iter(self.make_files(5))
+
+        with caplog.at_level("WARNING", logger="scripts.download_plots"):
+            found = find_plot_files(run, max_files=3)
+
+        assert [f.name for f in found] == [f"media/images/plot_{i}.png" for i in range(3)]
+        assert "more than 3 files" in caplog.text
+
+    def test_listing_within_cap_is_silent(self, caplog):
+        """Test no warning is logged when the whole listing fits the cap."""
+        run = Mock()
+        run.files.return_value = iter(self.make_files(3))
+
+        with caplog.at_level("WARNING", logger="scripts.download_plots"):
+            found = find_plot_files(run, max_files=3)
+
+        assert len(found) == 3
+        assert caplog.text == ""
+
+
+class TestDownloadPlotsBulk:
+    """Tests for download_plots_bulk function."""
+
+    @patch("scripts.download_plots.get_api")
+    @patch("scripts.download_plots.parse_entity_project")
+    def test_bulk_resolves_runs_in_one_query(
+        self,
+        mock_parse,
+        mock_get_api,
+        mock_file,
+        tmp_path
+    ):
+        """Test all runs are fetched with a single filtered runs query."""
+        mock_parse.return_value = ("test-entity", "test-project")
+
+        runs = []
+        for run_id in ("run-a", "run-b"):
+            run = Mock()
+            run.id = run_id
+            run.name = f"name-{run_id}"
+            run.entity = "test-entity"
+            run.project = "test-project"
+            run.files.return_value = [mock_file]
+            runs.append(run)
+
+        mock_api = Mock()
+        mock_api.runs.return_value = runs
+        mock_get_api.return_value = mock_api
+
+        output_dir = tmp_path / "out"
+        downloaded = download_plots_bulk(
+            "test-entity/test-project",
+            ["run-a", "run-b"],
+            output_dir=str(output_dir)
+        )
+
+        mock_api.runs.assert_called_once_with(
+            "test-entity/test-project",
+            filters={"name": {"$in": ["run-a", "run-b"]}}
+        )
+        assert list(downloaded) == ["run-a", "run-b"]
+        assert (output_dir / "run-a" / "plot.png").exists()
+        assert (output_dir / "run-b" / "plot.png").exists()
+
+    @patch("scripts.download_plots.get_api")
+    @patch("scripts.download_plots.parse_entity_project")
+    def test_bulk_missing_run_raises(self, mock_parse, mock_get_api):
+        """Test error when a requested run is not returned by the query."""
+        mock_parse.return_value = ("test-entity", "test-project")
+
+        run = Mock()
+        run.id = "run-a"
+        mock_api = Mock()
+        mock_api.runs.return_value = [run]
+        mock_get_api.return_value = mock_api
+
+        with pytest.raises(ValueError, match="Runs not found"):
+            download_plots_bulk("test-entity/test-project", ["run-a", "run-missing"])
@@ -2,111 +2,367 @@
 
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from scripts.generate_plots import generate_plots
+from scripts.generate_plots import (
+    _get_figure,
+    _metric_kind,
+    _plot_dtype,
+    _y_stats,
+    column_arrays,
+    determine_x_axis,
+    generate_plots,
+    history_rows_to_frame,
+    lttb_indices,
+    rolling_mean,
+    time_weighted_ema,
+)
+
+
+def reference_twema(x_values, y_values, weight, viewport_scale):
+    """Straightforward scalar TWEMA used to check the optimized version."""
+    x_list = list(x_values)
+    y_list = list(y_values)
+    range_of_x = float(max(x_list) - min(x_list)) or 1.0
+    last_y = 0.0
+    debias_weight = 0.0
+    smoothed = []
+    for idx, y_point in enumerate(y_list):
+        delta = x_list[idx] - x_list[idx - 1 if idx > 0 else 0]
+        smoothing_weight_adj = weight ** ((delta / range_of_x) * viewport_scale)
+        last_y = last_y * smoothing_weight_adj + y_point
+        debias_weight = debias_weight * smoothing_weight_adj + 1.0
+        smoothed.append(last_y / debias_weight)
+    return smoothed
+
+
+class TestLttbIndices:
+    """Tests for lttb_indices function."""
+
+    def test_short_series_untouched(self):
+        """Test that series shorter than the target are kept whole."""
+        np.testing.assert_array_equal(lttb_indices(np.arange(10), np.arange(10), 20), np.arange(10))
+
+    def test_keeps_endpoints_and_peaks(self):
+        """Test that endpoints and isolated spikes survive downsampling."""
+        n = 10000
+        x = np.arange(n, dtype=float)
+        y = np.zeros(n)
+        y[1234] = 100.0
+        y[7777] = -50.0
+
+        indices = lttb_indices(x, y, 100)
+
+        assert len(indices) == 100
+        assert indices[0] == 0
+        assert indices[-1] == n - 1
+        assert np.all(np.diff(indices) > 0)
+        assert 1234 in indices
+        assert 7777 in indices
+
+
+class TestRollingMean:
+    """Tests for rolling_mean function."""
+
+    @pytest.mark.parametrize("window", [1, 2, 5, 499, 500, 1000])
+    def test_matches_pandas_rolling(self, sample_history_df, window):
+        """Test agreement with pandas rolling mean using min_periods=1."""
+        y = sample_history_df["train/loss"].to_numpy()
+
+        expected = pd.Series(y).rolling(window=window, min_periods=1).mean().to_numpy()
+
+        np.testing.assert_allclose(rolling_mean(y, window), expected, rtol=1e-9)
+
+    def test_empty_input(self):
+        """Test that empty input yields an empty result."""
+        assert len(rolling_mean(np.array([]), 5)) == 0
+
+    def test_float32_input(self, sample_history_df):
+        """Test float32 input is averaged accurately and stays float32."""
+        y = sample_history_df["train/loss"].to_numpy()
+
+        smoothed = rolling_mean(y.astype(np.float32), 50)
+
+        assert smoothed.dtype == np.float32
+        np.testing.assert_allclose(smoothed, rolling_mean(y, 50), rtol=1e-5)
+
+
+class TestTimeWeightedEma:
+    """Tests for time_weighted_ema function."""
+
+    def test_empty_input(self):
+        """Test that empty input yields an empty result."""
+        assert len(time_weighted_ema([], [], 0.99, 1000.0)) == 0
+
+    def test_constant_series_unchanged(self):
+        """Test that the debiased EMA of a constant series is constant."""
+        smoothed = time_weighted_ema(range(50), [3.0] * 50, 0.99, 1000.0)
+        np.testing.assert_allclose(smoothed, 3.0)
+
+    @pytest.mark.parametrize("weight", [0.6, 0.9, 0.99])
+    def test_matches_reference(self, sample_history_df, weight):
+        """Test agreement with the scalar reference implementation."""
+        x = sample_history_df["_step"]
+        y = sample_history_df["train/loss"]
+
+        smoothed = time_weighted_ema(x, y, weight, 1000.0)
+
+        np.testing.assert_allclose(smoothed, reference_twema(x, y, weight, 1000.0), rtol=1e-9)
+
+    def test_datetime_x_axis(self):
+        """Test datetime x values are treated as seconds."""
+        x = pd.Series(pd.date_range("2024-01-01", periods=20, freq="s"))
+        y = np.linspace(0.0, 1.0, 20)
+
+        smoothed = time_weighted_ema(x, y, 0.9, 1000.0)
+
+        np.testing.assert_allclose(smoothed, reference_twema(range(20), y, 0.9, 1000.0), rtol=1e-9)
+
+    def test_float32_input(self, sample_history_df):
+        """Test float32 input is smoothed accurately and stays float32."""
+        x = sample_history_df["_step"]
+        y = sample_history_df["train/loss"].to_numpy()
+
+        smoothed = time_weighted_ema(x, y.astype(np.float32), 0.99, 1000.0)
+
+        assert smoothed.dtype == np.float32
+        np.testing.assert_allclose(smoothed, time_weighted_ema(x, y, 0.99, 1000.0), rtol=1e-5)
+
+
+@pytest.mark.parametrize("metric,kind", [
+    ("train/loss", "loss"),
+    ("val/Loss_ema", "loss"),
+    ("val/accuracy", "acc"),
+    ("top1_acc", "acc"),
+    ("learning_rate", "other"),
+])
+def test_metric_kind(metric, kind):
+    """Test metric names are classified for y-axis scaling."""
+    assert _metric_kind(metric) == kind
+
+
+@pytest.mark.parametrize("column_sets,expected", [
+    ([["_step", "_timestamp", "loss"]], ("_step", "Step")),
+    ([["_timestamp", "loss"]], ("_timestamp", "Timestamp")),
+    ([["loss"], ["_timestamp", "loss"]], ("_timestamp", "Timestamp")),
+    ([["loss"]], (None, "Index")),
+])
+def test_determine_x_axis(column_sets, expected):
+    """Test the first run with an x-axis column picks the shared axis."""
+    assert determine_x_axis(column_sets) == expected
+
+
+@pytest.mark.parametrize("kind,values,dtype", [
+    ("other", np.linspace(0.0, 1.0, 100), np.float32),
+    ("other", np.linspace(1704067200, 1704070800, 5000), np.float64),
+    ("other", 1.0 + np.linspace(0.0, 1e-6, 100), np.float64),
+    ("loss", np.logspace(-8, 1, 100), np.float64),
+    ("loss", np.linspace(0.1, 2.0, 100), np.float32),
+])
+def test_plot_dtype(kind, values, dtype):
+    """Test float32 is only used where it keeps the series' distinct levels."""
+    assert _plot_dtype(kind, _y_stats([values])) is dtype
+
+
+class TestYStats:
+    """Tests for _y_stats helper."""
+
+    def test_stats_across_arrays(self):
+        """Test min, max and smallest positive value span all arrays."""
+        stats = _y_stats([np.array([-1.0, 0.5, 3.0]), np.array([]), np.array([0.0, 0.2, 7.0])])
+
+        assert stats == (-1.0, 7.0, 0.2)
+
+    def test_no_positive_values(self):
+        """Test the positive minimum stays infinite when nothing is positive."""
+        assert _y_stats([np.array([-2.0, 0.0])]) == (-2.0, 0.0, np.inf)
+
+
+class TestHistoryRowsToFrame:
+    """Tests for history_rows_to_frame function."""
+
+    def test_matches_dataframe_constructor(self, sample_history_df, sample_history_records):
+        """Test rows are assembled into the same frame pandas would build."""
+        df = history_rows_to_frame(sample_history_records, keys=list(sample_history_df.columns))
+
+        pd.testing.assert_frame_equal(df, pd.DataFrame(sample_history_records))
+
+    def test_keys_select_columns(self):
+        """Test given keys fix the columns and fill rows missing one with NaN."""
+        rows = [{"_step": 0, "a": 1.0, "extra": "x"}, {"_step": 1}]
+
+        df = history_rows_to_frame(rows, keys=["_step", "a"])
+
+        assert list(df.columns) == ["_step", "a"]
+        assert df["_step"].tolist() == [0, 1]
+        assert df["a"].isna().tolist() == [False, True]
+
+    def test_single_key(self):
+        """Test a single key yields a float column, with NaN where a row lacks it."""
+        df = history_rows_to_frame([{"a": 1.0}, {"b": 2}, {"a": 3.0}], keys=["a"])
+
+        assert df["a"].dtype == np.float64
+        assert df["a"].isna().tolist() == [False, True, False]
+        assert df["a"].dropna().tolist() == [1.0, 3.0]
+
+    def test_sparse_and_late_keys(self):
+        """Test missing values and keys first seen mid-stream become NaN."""
+        rows = [{"_step": 0, "a": 1.0}, {"_step": 1}, {"_step": 2, "a": 3.0, "b": 5.0}]
+
+        df = history_rows_to_frame(rows)
+
+        assert df["_step"].tolist() == [0, 1, 2]
+        assert df["a"].isna().tolist() == [False, True, False]
+        assert df["b"].isna().tolist() == [True, True, False]
+
+    def test_column_dtypes(self):
+        """Test numeric columns are typed and other values kept as objects."""
+        rows = [
+            {"_step": 0, "loss": 1.0, "media": {"path": "a.png"}, "tags": [1, 2]},
+            {"_step": 1, "loss": None, "media": {"path": "b.png"}, "tags": [3, 4]},
+        ]
+
+        df = history_rows_to_frame(rows)
+
+        assert df["_step"].dtype == np.int64
+        assert df["loss"].dtype == np.float64
+        assert df["media"].tolist() == [{"path": "a.png"}, {"path": "b.png"}]
+        assert df["tags"].tolist() == [[1, 2], [3, 4]]
+
+    def test_empty_rows(self):
+        """Test an empty stream gives an empty frame."""
+        assert history_rows_to_frame([], keys=["a"]).empty
+
+
+class TestColumnArrays:
+    """Tests for column_arrays function."""
+
+    def test_extracts_metrics_and_x_axes(self, sample_history_df):
+        """Test requested metrics and x-axis columns become numpy arrays."""
+        columns = column_arrays(sample_history_df, ["train/loss", "missing"])
+
+        assert set(columns) == {"_step", "_timestamp", "train/loss"}
+        assert isinstance(columns["train/loss"], np.ndarray)
+        np.testing.assert_array_equal(columns["_step"], sample_history_df["_step"].to_numpy())
+
+    def test_only_requested_x_axis(self, sample_history_df):
+        """Test a given x-axis key excludes the other x-axis columns."""
+        columns = column_arrays(sample_history_df, ["train/loss"], x_key="_step")
+
+        assert set(columns) == {"_step", "train/loss"}
+
+    def test_nullable_values_become_nan(self):
+        """Test missing values in nullable columns are converted to NaN."""
+        df = pd.DataFrame({"loss": pd.array([1.0, None, 3.0], dtype="Float64")})
+
+        columns = column_arrays(df, ["loss"])
+
+        assert columns["loss"].dtype == np.float64
+        assert np.isnan(columns["loss"][1])
 
 
 class TestGeneratePlots:
     """Tests for generate_plots function."""
 
-    @patch("scripts.generate_plots.get_run")
-    def test_generate_basic_plots(self, mock_get_run, sample_history_df, tmp_path):
-        """Test generating plots with sampled history data."""
-        run = Mock()
-        run.id = "run-123"
-        run.name = "test-run"
-        run.entity = "test-entity"
-        run.project = "test-project"
-        run.history.return_value = sample_history_df
-        mock_get_run.return_value = run
+    @pytest.fixture(autouse=True)
+    def mock_get_run(self, monkeypatch):
+        """Replace get_run for every test; tests set its return_value or side_effect."""
+        get_run = Mock()
+        monkeypatch.setattr("scripts.generate_plots.get_run", get_run)
+        return get_run
+
+    @pytest.mark.parametrize("metrics,options", [
+        (["train/loss", "val/accuracy"], {}),
+        (["train/loss"], {"full_resolution": True}),
+        (["train/loss"], {"smooth": 5}),
+    ], ids=["sampled", "full_resolution", "smoothing"])
+    def test_generate_plots(self, mock_get_run, make_run_mock, tmp_path, metrics, options):
+        """Test generating plots from sampled or full-resolution history, with and without smoothing."""
+        mock_get_run.return_value = make_run_mock()
 
         output_dir = tmp_path / "out"
 
         generated = generate_plots(
             "test-entity/test-project",
             "run-123",
-            ["train/loss", "val/accuracy"],
-            output_dir=str(output_dir)
+            metrics,
+            output_dir=str(output_dir),
+            **options
         )
 
-        assert len(generated) == 2
-        assert Path(generated[0]).exists()
-        assert (output_dir / "metadata.json").exists()
+        assert len(generated) == len(metrics)
+        assert all(Path(p).exists() for p in generated)
 
         with open(output_dir / "metadata.json", "r") as f:
             metadata = json.load(f)
 
-        assert metadata["plot_count"] == 2
-        assert "train/loss" in metadata["metrics_plotted"]
-
-    @patch("scripts.generate_plots.get_run")
-    def test_generate_with_full_resolution(self, mock_get_run, sample_history_df, tmp_path):
-        """Test generating plots using full resolution scan_history."""
-        run = Mock()
-        run.id = "run-123"
-        run.name = "test-run"
-        run.entity = "test-entity"
-        run.project = "test-project"
-        run.scan_history.return_value = sample_history_df.to_dict(orient="records")
-        mock_get_run.return_value = run
+        assert metadata["plot_count"] == len(metrics)
+        assert metadata["metrics_plotted"] == metrics
 
-        output_dir = tmp_path / "out"
+    def test_generate_repeated_run_fetched_once(self, mock_get_run, make_run_mock, tmp_path):
+        """Test a run id given twice is only looked up and fetched once."""
+        run = make_run_mock()
+        mock_get_run.return_value = run
 
         generated = generate_plots(
             "test-entity/test-project",
-            "run-123",
+            "run-123,run-123",
             ["train/loss"],
-            full_resolution=True,
-            output_dir=str(output_dir)
+            output_dir=str(tmp_path / "out")
         )
 
         assert len(generated) == 1
-        assert Path(generated[0]).exists()
+        mock_get_run.assert_called_once()
+        run.history.assert_called_once()
 
-    @patch("scripts.generate_plots.get_run")
-    def test_generate_with_smoothing(self, mock_get_run, sample_history_df, tmp_path):
-        """Test generating plots with smoothing enabled."""
-        run = Mock()
-        run.id = "run-123"
-        run.name = "test-run"
-        run.entity = "test-entity"
-        run.project = "test-project"
-        run.history.return_value = sample_history_df
+    def test_generate_reuses_cleared_figure(self, mock_get_run, make_run_mock, tmp_path):
+        """Test plots share one figure whose axes are cleared after each save."""
+        run = make_run_mock()
         mock_get_run.return_value = run
+        fig, ax = _get_figure()
 
-        output_dir = tmp_path / "out"
+        generated = generate_plots(
+            "test-entity/test-project",
+            "run-123",
+            ["train/loss", "val/accuracy"],
+            output_dir=str(tmp_path / "out"),
+            workers=1
+        )
+
+        assert len(generated) == 2
+        assert _get_figure() == (fig, ax)
+        assert not ax.lines
+        assert ax.get_yscale() == "linear"
+
+    def test_generate_ignores_non_finite_values(self, mock_get_run, make_run_mock, sample_history_df, tmp_path):
+        """Test NaN and +/-inf points are dropped before plotting."""
+        df = sample_history_df.copy()
+        df.loc[::7, "train/loss"] = np.inf
+        df.loc[::11, "train/loss"] = -np.inf
+        df.loc[::13, "train/loss"] = np.nan
+        run = make_run_mock()
+        run.history.return_value = df
+        mock_get_run.return_value = run
 
         generated = generate_plots(
             "test-entity/test-project",
             "run-123",
             ["train/loss"],
-            smooth=5,
-            output_dir=str(output_dir)
+            output_dir=str(tmp_path / "out"),
+            workers=1
         )
 
         assert len(generated) == 1
         assert Path(generated[0]).exists()
 
-    @patch("scripts.generate_plots.get_run")
-    def test_generate_with_multiple_runs(self, mock_get_run, sample_history_df, tmp_path):
+    def test_generate_with_multiple_runs(self, mock_get_run, make_run_mock, tmp_path):
         """Test generating plots across multiple runs."""
-        run_a = Mock()
-        run_a.id = "run-aaa"
-        run_a.name = "test-run-a"
-        run_a.entity = "test-entity"
-        run_a.project = "test-project"
-        run_a.history.return_value = sample_history_df
-
-        run_b = Mock()
-        run_b.id = "run-bbb"
-        run_b.name = "test-run-b"
-        run_b.entity = "test-entity"
-        run_b.project = "test-project"
-        run_b.history.return_value = sample_history_df
+        run_a = make_run_mock(id="run-aaa", name="test-run-a")
+        run_b = make_run_mock(id="run-bbb", name="test-run-b")
 
         mock_get_run.side_effect = [run_a, run_b]
 
@@ -128,15 +384,9 @@ class TestGeneratePlots:
 
         assert metadata["run_ids"] == ["run-aaa", "run-bbb"]
 
-    @patch("scripts.generate_plots.get_run")
-    def test_generate_with_group_by_prefix(self, mock_get_run, sample_history_df, tmp_path):
+    def test_generate_with_group_by_prefix(self, mock_get_run, make_run_mock, tmp_path):
         """Test grouping output by metric prefix."""
-        run = Mock()
-        run.id = "run-123"
-        run.name = "test-run"
-        run.entity = "test-entity"
-        run.project = "test-project"
-        run.history.return_value = sample_history_df
+        run = make_run_mock()
         mock_get_run.return_value = run
 
         output_dir = tmp_path / "out"
@@ -153,15 +403,9 @@ class TestGeneratePlots:
         assert Path(generated[0]).exists()
         assert (output_dir / "train" / "train_loss.png").exists()
 
-    @patch("scripts.generate_plots.get_run")
-    def test_generate_with_all_metrics(self, mock_get_run, sample_history_df, tmp_path):
+    def test_generate_with_all_metrics(self, mock_get_run, make_run_mock, tmp_path):
         """Test generating plots for all metrics."""
-        run = Mock()
-        run.id = "run-123"
-        run.name = "test-run"
-        run.entity = "test-entity"
-        run.project = "test-project"
-        run.history.return_value = sample_history_df
+        run = make_run_mock()
         mock_get_run.return_value = run
 
         output_dir = tmp_path / "out"
@@ -187,13 +431,50 @@ class TestGeneratePlots:
             filename = metric.replace("/", "_") + ".png"
             assert (output_dir / filename).exists()
 
-    @patch("scripts.generate_plots.get_run")
-    def test_missing_metrics_raises(self, mock_get_run, sample_history_df):
-        """Test error when requested metrics are missing."""
-        run = Mock()
-        run.history.return_value = sample_history_df
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_generate_with_workers(self, mock_get_run, make_run_mock, tmp_path, workers):
+        """Test serial and process-pool rendering give the same ordered outputs."""
+        run = make_run_mock()
+        mock_get_run.return_value = run
+
+        output_dir = tmp_path / "out"
+        metrics = ["val/loss", "train/loss", "learning_rate"]
+
+        generated = generate_plots(
+            "test-entity/test-project",
+            "run-123",
+            metrics,
+            output_dir=str(output_dir),
+            workers=workers
+        )
+
+        assert [Path(p).name for p in generated] == ["val_loss.png", "train_loss.png", "learning_rate.png"]
+        assert all(Path(p).exists() for p in generated)
+
+    def test_generate_downsamples_long_history(self, mock_get_run, make_run_mock, tmp_path):
+        """Test plotting a history long enough to trigger downsampling."""
+        n_points = 20000
+        run = make_run_mock()
+        run.history.return_value = pd.DataFrame({
+            "_step": np.arange(n_points),
+            "train/loss": np.exp(-np.linspace(0, 3, n_points)),
+        })
         mock_get_run.return_value = run
 
+        generated = generate_plots(
+            "test-entity/test-project",
+            "run-123",
+            ["train/loss"],
+            output_dir=str(tmp_path / "out")
+        )
+
+        assert len(generated) == 1
+        assert Path(generated[0]).exists()
+
+    def test_missing_metrics_raises(self, mock_get_run, make_run_mock):
+        """Test error when requested metrics are missing."""
+        mock_get_run.return_value = make_run_mock()
+
         with pytest.raises(ValueError, match="Metrics not found"):
             generate_plots(
                 "test-entity/test-project",
@@ -201,10 +482,9 @@ class TestGeneratePlots:
                 ["missing/metric"]
             )
 
-    @patch("scripts.generate_plots.get_run")
-    def test_empty_history_raises(self, mock_get_run):
+    def test_empty_history_raises(self, mock_get_run, make_run_mock):
         """Test error when run has no history data."""
-        run = Mock()
+        run = make_run_mock()
         run.history.return_value = pd.DataFrame()
         mock_get_run.return_value = run
 
@@ -1,7 +1,5 @@
 """Integration tests for full W&B plot workflow."""
 
-import os
-
 import pytest
 
 from scripts.list_runs import list_runs
@@ -11,8 +9,8 @@ from scripts.generate_plots import generate_plots
 
 
 @pytest.mark.integration
-@pytest.mark.skipif(not os.getenv("WANDB_API_KEY"), reason="No W&B API key")
-def test_full_workflow(tmp_path):
+@pytest.mark.network
+def test_full_workflow(wandb_network, tmp_path):
     """Test full workflow: list runs -> metrics -> download -> generate."""
     runs = list_runs("wandb/test-project", limit=1)
     assert len(runs) > 0
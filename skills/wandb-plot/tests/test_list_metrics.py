@@ -3,6 +3,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from scripts.list_metrics import list_metrics, format_metrics_table
@@ -14,9 +15,7 @@ class TestListMetrics:
     @patch('scripts.list_metrics.get_run')
     def test_list_basic_metrics(self, mock_get_run, sample_metrics_data):
         """Test listing basic numeric metrics."""
-        mock_run = Mock()
-        mock_run.history.return_value = sample_metrics_data
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: sample_metrics_data)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -30,9 +29,7 @@ class TestListMetrics:
     @patch('scripts.list_metrics.get_run')
     def test_list_metrics_with_system_columns(self, mock_get_run, sample_metrics_data):
         """Test including system columns."""
-        mock_run = Mock()
-        mock_run.history.return_value = sample_metrics_data
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: sample_metrics_data)
 
         metrics = list_metrics(
             "test-entity/test-project",
@@ -50,13 +47,11 @@ class TestListMetrics:
         """Test that statistics are calculated correctly."""
         # Create simple test data
         test_df = pd.DataFrame({
-            'metric1': [1.0, 2.0, 3.0, 4.0, 5.0],
-            'metric2': [10, 20, 30, 40, 50]
+            'metric1': np.array([1.0, 2.0, 3.0, 4.0, 5.0]),
+            'metric2': np.array([10, 20, 30, 40, 50], dtype=np.int64)
         })
 
-        mock_run = Mock()
-        mock_run.history.return_value = test_df
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -68,12 +63,36 @@ class TestListMetrics:
         assert metrics["metric1"]["non_null_count"] == 5
         assert metrics["metric1"]["type"] == "numeric"
 
+    @patch('scripts.list_metrics.get_run')
+    def test_mixed_column_types(self, mock_get_run):
+        """Test numeric and non-numeric columns are summarized together."""
+        test_df = pd.DataFrame({
+            'loss': [0.5, np.nan, 0.25],
+            'epoch': [1, 2, 3],
+            'status': ['a', 'b', None],
+        })
+
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
+
+        metrics = list_metrics("test-entity/test-project", "abc123")
+
+        assert metrics["loss"] == {
+            "type": "numeric",
+            "count": 3,
+            "non_null_count": 2,
+            "min": 0.25,
+            "max": 0.5,
+            "mean": 0.375,
+            "std": pytest.approx(0.1767767),
+        }
+        assert metrics["epoch"]["max"] == 3.0
+        assert metrics["status"] == {"type": "string", "count": 3, "non_null_count": 2}
+        assert isinstance(metrics["status"]["non_null_count"], int)
+
     @patch('scripts.list_metrics.get_run')
     def test_empty_history(self, mock_get_run):
         """Test handling of empty history."""
-        mock_run = Mock()
-        mock_run.history.return_value = pd.DataFrame()
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: pd.DataFrame())
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -83,13 +102,11 @@ class TestListMetrics:
     def test_metrics_with_missing_values(self, mock_get_run):
         """Test handling metrics with NaN values."""
         test_df = pd.DataFrame({
-            'metric1': [1.0, 2.0, np.nan, 4.0, 5.0],
-            'metric2': [10, np.nan, np.nan, 40, 50]
+            'metric1': np.array([1.0, 2.0, np.nan, 4.0, 5.0]),
+            'metric2': np.array([10, np.nan, np.nan, 40, 50])
         })
 
-        mock_run = Mock()
-        mock_run.history.return_value = test_df
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -101,13 +118,11 @@ class TestListMetrics:
     def test_skip_all_null_columns(self, mock_get_run):
         """Test that columns with all NaN values are skipped."""
         test_df = pd.DataFrame({
-            'metric1': [1.0, 2.0, 3.0],
-            'all_null': [np.nan, np.nan, np.nan]
+            'metric1': np.array([1.0, 2.0, 3.0]),
+            'all_null': np.full(3, np.nan)
         })
 
-        mock_run = Mock()
-        mock_run.history.return_value = test_df
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -118,13 +133,11 @@ class TestListMetrics:
     def test_string_metrics(self, mock_get_run):
         """Test handling of string-type metrics."""
         test_df = pd.DataFrame({
-            'status': ['running', 'finished', 'running'],
-            'model_name': ['model_v1', 'model_v2', 'model_v1']
+            'status': np.array(['running', 'finished', 'running'], dtype=object),
+            'model_name': np.array(['model_v1', 'model_v2', 'model_v1'], dtype=object)
         })
 
-        mock_run = Mock()
-        mock_run.history.return_value = test_df
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -136,13 +149,11 @@ class TestListMetrics:
     def test_boolean_metrics(self, mock_get_run):
         """Test handling of boolean-type metrics."""
         test_df = pd.DataFrame({
-            'is_best': [True, False, True, False],
-            'converged': [False, False, True, True]
+            'is_best': np.array([True, False, True, False]),
+            'converged': np.array([False, False, True, True])
         })
 
-        mock_run = Mock()
-        mock_run.history.return_value = test_df
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -155,16 +166,14 @@ class TestListMetrics:
     def test_filter_system_prefixes(self, mock_get_run):
         """Test filtering of various system prefixes."""
         test_df = pd.DataFrame({
-            '_step': [1, 2, 3],
-            '_timestamp': [100, 200, 300],
-            'system/cpu': [50, 60, 70],
-            'gradients/layer1': [0.1, 0.2, 0.3],
-            'user_metric': [1.0, 2.0, 3.0]
+            '_step': np.array([1, 2, 3], dtype=np.int64),
+            '_timestamp': np.array([100, 200, 300], dtype=np.int64),
+            'system/cpu': np.array([50, 60, 70], dtype=np.int64),
+            'gradients/layer1': np.array([0.1, 0.2, 0.3]),
+            'user_metric': np.array([1.0, 2.0, 3.0])
         })
 
-        mock_run = Mock()
-        mock_run.history.return_value = test_df
-        mock_get_run.return_value = mock_run
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
 
         metrics = list_metrics("test-entity/test-project", "abc123")
 
@@ -175,6 +184,94 @@ class TestListMetrics:
         assert "system/cpu" not in metrics
         assert "gradients/layer1" not in metrics
 
+    @patch('scripts.list_metrics.get_run')
+    def test_object_columns_classified_by_values(self, mock_get_run):
+        """Test object columns are typed by their values and others by dtype."""
+        test_df = pd.DataFrame({
+            'media': [{'_type': 'image-file'}, None],
+            'label': np.array(['a', None], dtype=object),
+            'when': pd.to_datetime(['2024-01-01', '2024-01-02']),
+        })
+
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
+
+        metrics = list_metrics("test-entity/test-project", "abc123")
+
+        assert metrics['media']['type'] == 'object'
+        assert metrics['label']['type'] == 'string'
+        assert metrics['when']['type'].startswith('datetime64')
+
+    @patch('scripts.list_metrics.get_run')
+    def test_wide_history_matches_pandas_reductions(self, mock_get_run):
+        """Test matrix statistics agree with pandas on sparse, mixed-dtype columns."""
+        rng = np.random.default_rng(0)
+        test_df = pd.DataFrame(rng.normal(100.0, 5.0, (200, 20))).add_prefix('m')
+        test_df = test_df.mask(rng.random(test_df.shape) < 0.3)
+        test_df['single'] = [2.0] + [np.nan] * 199
+        test_df['flag'] = rng.random(200) > 0.5
+        test_df['steps'] = np.arange(200)
+
+        mock_get_run.return_value = SimpleNamespace(history=lambda **kwargs: test_df)
+
+        metrics = list_metrics("test-entity/test-project", "abc123")
+
+        for col in test_df.columns:
+            expected = test_df[col].astype(float).agg(['min', 'max', 'mean', 'std'])
+            for name, value in expected.items():
+                assert metrics[col][name] == pytest.approx(value, nan_ok=True)
+
+    @patch('scripts.list_metrics.get_run')
+    def test_samples_passed_to_history(self, mock_get_run):
+        """Test the sample count is forwarded to run.history."""
+        mock_run = Mock()
+        mock_run.history.return_value = pd.DataFrame({'loss': [1.0, 2.0]})
+        mock_get_run.return_value = mock_run
+
+        list_metrics("test-entity/test-project", "abc123", samples=100)
+
+        mock_run.history.assert_called_once_with(samples=100)
+
+    @patch('scripts.list_metrics.get_run')
+    def test_without_stats_uses_summary(self, mock_get_run):
+        """Test names and types come from the summary without fetching history."""
+        mock_run = Mock()
+        mock_run.id = "abc123"
+        mock_run.summary = {
+            'loss': 0.1,
+            'status': 'done',
+            'samples': {'_type': 'table-file'},
+            'unset': None,
+            '_runtime': 12.0,
+        }
+        mock_get_run.return_value = mock_run
+
+        metrics = list_metrics("test-entity/test-project", "abc123", with_stats=False)
+
+        mock_run.history.assert_not_called()
+        assert metrics == {
+            'loss': {'type': 'numeric'},
+            'status': {'type': 'string'},
+            'samples': {'type': 'object'},
+        }
+
+    @patch('scripts.list_metrics.get_run')
+    def test_without_stats_probes_history_for_empty_summary(self, mock_get_run):
+        """Test a one-row history probe is used when the summary has no metrics."""
+        mock_run = Mock()
+        mock_run.id = "abc123"
+        mock_run.summary = {'_runtime': 12.0}
+        mock_run.history.return_value = pd.DataFrame({
+            '_step': [0],
+            'loss': [1.0],
+            'sparse': [np.nan],
+        })
+        mock_get_run.return_value = mock_run
+
+        metrics = list_metrics("test-entity/test-project", "abc123", with_stats=False)
+
+        mock_run.history.assert_called_once_with(samples=1)
+        assert metrics == {'loss': {'type': 'numeric'}}
+
     @patch('scripts.list_metrics.get_run')
     def test_history_fetch_error(self, mock_get_run):
         """Test error handling when fetching history fails."""
@@ -62,7 +62,7 @@ class TestListProjects:
 
         list_projects(entity="my-org")
 
-        mock_api.projects.assert_called_once_with("my-org")
+        mock_api.projects.assert_called_once_with("my-org", per_page=100)
 
     @patch("scripts.list_projects.get_api")
     def test_list_projects_limit(self, mock_get_api):
@@ -86,6 +86,7 @@ class TestListProjects:
         assert len(result) == 2
         assert result[0]["name"] == "project-0"
         assert result[1]["name"] == "project-1"
+        mock_api.projects.assert_called_once_with("test-entity", per_page=2)
 
     @patch("scripts.list_projects.get_api")
     def test_list_projects_error(self, mock_get_api):
@@ -4,7 +4,12 @@ import pytest
 from unittest.mock import Mock, patch
 import json
 
-from scripts.list_runs import list_runs, format_run_table
+from datetime import datetime
+
+import numpy as np
+
+from scripts.list_runs import list_runs, format_run_table, json_default
+from scripts.wandb_utils import dumps_json
 
 
 class TestListRuns:
@@ -91,15 +96,18 @@ class TestListRuns:
             mock_run.tags = []
             mock_runs.append(mock_run)
 
+        runs_iterator = iter(mock_runs)
         mock_api = Mock()
-        mock_api.runs.return_value = mock_runs
+        mock_api.runs.return_value = runs_iterator
         mock_get_api.return_value = mock_api
 
         runs = list_runs("test-entity/test-project", limit=5)
 
-        assert len(runs) == 5
-        assert runs[0]["id"] == "run0"
-        assert runs[4]["id"] == "run4"
+        # Details are resolved in parallel but keep the listing order
+        assert [run["id"] for run in runs] == [f"run{i}" for i in range(5)]
+        # The page size follows the limit and no run past it is pulled
+        assert mock_api.runs.call_args[1]["per_page"] == 5
+        assert next(runs_iterator).id == "run5"
 
     @patch('scripts.list_runs.get_api')
     @patch('scripts.list_runs.parse_entity_project')
@@ -176,6 +184,40 @@ class TestListRuns:
         assert runs[0]["tags"] == ["baseline", "v1"]
 
 
+class TestJsonDefault:
+    """Tests for json_default encoder hook."""
+
+    def test_encodes_summary_values(self):
+        """Test nested summary objects, datetimes and numpy values are encoded."""
+        class SummarySubDict:
+            def items(self):
+                return [("_type", "histogram"), ("bins", np.arange(3))]
+
+        summary = {
+            "loss": np.float32(0.5),
+            "step": np.int64(7),
+            "finished": datetime(2024, 1, 1, 12, 30),
+            "hist": SummarySubDict(),
+            "labels": {"b", "a"},
+        }
+
+        encoded = json.loads(dumps_json(summary, default=json_default))
+
+        assert encoded["loss"] == 0.5
+        assert encoded["step"] == 7
+        assert encoded["finished"].startswith("2024-01-01T12:30:00")
+        assert encoded["hist"] == {"_type": "histogram", "bins": [0, 1, 2]}
+        assert sorted(encoded["labels"]) == ["a", "b"]
+
+    def test_unknown_values_become_strings(self):
+        """Test values with no known conversion fall back to str()."""
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        assert json_default(Opaque()) == "opaque"
+
+
 class TestFormatRunTable:
     """Tests for format_run_table function."""
 
@@ -1,18 +1,25 @@
 """Unit tests for wandb_utils module."""
 
+import json
+
 import pytest
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 import wandb
 
 from scripts.wandb_utils import (
     WandBAuthError,
     get_api,
+    get_default_entity,
     parse_entity_project,
     get_run,
     ensure_output_dir,
     format_entity_project,
+    progress_wrap,
+    resolve_output_dir,
+    safe_filename,
+    write_metadata_json,
 )
 
 
@@ -45,6 +52,27 @@ class TestGetApi:
         assert api is not None
         mock_api_class.assert_called_once()
 
+    @patch('scripts.wandb_utils.wandb.Api')
+    def test_api_instance_is_reused(self, mock_api_class):
+        """Test that repeated calls share one API instance."""
+        mock_api_instance = Mock()
+        mock_api_instance.viewer = {"username": "test-user"}
+        mock_api_class.return_value = mock_api_instance
+
+        assert get_api() is get_api()
+        mock_api_class.assert_called_once()
+
+    @patch('scripts.wandb_utils.wandb.Api')
+    def test_viewer_probe_seeds_default_entity(self, mock_api_class):
+        """Test the default entity is resolved from the authentication probe."""
+        mock_api_instance = Mock()
+        viewer = PropertyMock(return_value={"username": "test-user", "entity": "test-entity"})
+        type(mock_api_instance).viewer = viewer
+        mock_api_class.return_value = mock_api_instance
+
+        assert get_default_entity(get_api()) == "test-entity"
+        viewer.assert_called_once()
+
     @patch('scripts.wandb_utils.wandb.Api')
     def test_authentication_failure_usage_error(self, mock_api_class):
         """Test authentication failure with UsageError."""
@@ -95,6 +123,27 @@ class TestGetApi:
         assert api.viewer.username == "test-user"
 
 
+class TestGetDefaultEntity:
+    """Tests for get_default_entity function."""
+
+    def test_viewer_looked_up_once_per_api(self):
+        """Test that repeated lookups reuse the cached viewer entity."""
+        mock_api = Mock()
+        viewer = PropertyMock(return_value={"entity": "default-entity"})
+        type(mock_api).viewer = viewer
+
+        assert get_default_entity(mock_api) == "default-entity"
+        assert get_default_entity(mock_api) == "default-entity"
+        viewer.assert_called_once()
+
+    def test_username_fallback(self):
+        """Test falling back to username when viewer has no entity."""
+        mock_api = Mock()
+        mock_api.viewer = SimpleNamespace(entity=None, username="test-user")
+
+        assert get_default_entity(mock_api) == "test-user"
+
+
 class TestParseEntityProject:
     """Tests for parse_entity_project function."""
 
@@ -108,6 +157,23 @@ class TestParseEntityProject:
         # Should not need to call API when entity is provided
         mock_get_api.assert_not_called()
 
+    def test_repeated_invalid_input_still_raises(self):
+        """Test that memoized parsing does not swallow repeated errors."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid format"):
+                parse_entity_project("a/b/c")
+
+    @patch('scripts.wandb_utils.get_api')
+    def test_project_only_resolves_current_entity(self, mock_get_api):
+        """Test that cached parsing still resolves the entity from the current API."""
+        first_api = Mock()
+        first_api.viewer = {"entity": "first-entity"}
+        second_api = Mock()
+        second_api.viewer = {"entity": "second-entity"}
+
+        assert parse_entity_project("my-project", api=first_api) == ("first-entity", "my-project")
+        assert parse_entity_project("my-project", api=second_api) == ("second-entity", "my-project")
+
     @patch('scripts.wandb_utils.get_api')
     def test_parse_project_only(self, mock_get_api):
         """Test parsing 'project' format without entity."""
@@ -341,6 +407,102 @@ class TestEnsureOutputDir:
         assert output_dir.exists()
 
 
+class TestResolveOutputDir:
+    """Tests for resolve_output_dir function."""
+
+    def test_uses_run_attributes(self, tmp_path):
+        """Test the directory is built from the run's own entity and project."""
+        run = SimpleNamespace(entity="org", project="proj", id="abc123", name="exp")
+
+        path = resolve_output_dir("ignored/ignored", run, base_dir=str(tmp_path))
+
+        assert path == tmp_path / "org_proj" / "exp_abc123"
+        assert path.is_dir()
+
+    def test_partial_run_falls_back_to_entity_project(self, tmp_path):
+        """Test runs lacking entity/project attributes use the given path."""
+        run = SimpleNamespace(id="abc123")
+
+        path = resolve_output_dir("org/proj", run, base_dir=str(tmp_path))
+
+        assert path == tmp_path / "org_proj" / "abc123"
+
+
+class TestProgressWrap:
+    """Tests for progress_wrap function."""
+
+    def test_yields_all_items(self):
+        """Test wrapped iterables yield every item in order."""
+        assert list(progress_wrap(iter(range(5)), "Items")) == [0, 1, 2, 3, 4]
+
+    def test_passes_tqdm_options(self):
+        """Test extra keyword arguments reach tqdm."""
+        with patch("scripts.wandb_utils._tqdm") as mock_tqdm:
+            progress_wrap([1, 2], "Items", miniters=1000)
+
+        mock_tqdm.assert_called_once_with([1, 2], desc="Items", miniters=1000)
+
+    def test_returns_items_without_tqdm(self):
+        """Test the iterable is returned unchanged when tqdm is missing."""
+        items = [1, 2]
+        with patch("scripts.wandb_utils._tqdm", None):
+            assert progress_wrap(items, "Items") is items
+
+
+class TestSafeFilename:
+    """Tests for safe_filename function."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("train/loss", "train_loss"),
+        ("a\\b/c", "a_b_c"),
+        ("plain", "plain"),
+        ("", "unnamed"),
+    ])
+    def test_replaces_path_separators(self, name, expected):
+        """Test path separators are replaced and empty names get a default."""
+        assert safe_filename(name) == expected
+
+
+class TestWriteMetadataJson:
+    """Tests for write_metadata_json function."""
+
+    def test_merge_with_existing(self, tmp_path):
+        """Test that new keys are merged over existing metadata."""
+        (tmp_path / "metadata.json").write_text(json.dumps({"a": 1, "b": 2}))
+
+        write_metadata_json(tmp_path, {"b": 3, "c": [1, 2]})
+
+        with open(tmp_path / "metadata.json", "r") as f:
+            assert json.load(f) == {"a": 1, "b": 3, "c": [1, 2]}
+
+    def test_overwrite_without_merge(self, tmp_path):
+        """Test that merge=False replaces existing metadata."""
+        (tmp_path / "metadata.json").write_text(json.dumps({"a": 1}))
+
+        write_metadata_json(tmp_path, {"b": 2}, merge=False)
+
+        with open(tmp_path / "metadata.json", "r") as f:
+            assert json.load(f) == {"b": 2}
+
+    def test_non_string_keys_fall_back_to_json(self, tmp_path):
+        """Test metadata with non-string keys is still written."""
+        write_metadata_json(tmp_path, {"counts": {1: "one"}}, merge=False)
+
+        with open(tmp_path / "metadata.json", "r") as f:
+            assert json.load(f) == {"counts": {"1": "one"}}
+
+    def test_failed_serialization_keeps_existing_file(self, tmp_path):
+        """Test that unserializable metadata leaves the previous file intact."""
+        (tmp_path / "metadata.json").write_text(json.dumps({"a": 1}))
+
+        with pytest.raises(TypeError):
+            write_metadata_json(tmp_path, {"bad": object()})
+
+        with open(tmp_path / "metadata.json", "r") as f:
+            assert json.load(f) == {"a": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["metadata.json"]
+
+
 class TestFormatEntityProject:
     """Tests for format_entity_project function."""
 